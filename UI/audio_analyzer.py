@@ -1,3 +1,4 @@
+import math
 import time
 import numpy as np
 import soundfile as sf
@@ -87,7 +88,7 @@ class AudioAnalyzer:
         win = int(self.sr * 0.02)
         i0, i1 = max(0, idx - win // 2), min(len(self.audio), idx + win // 2)
         window = self.audio[i0:i1] if i1 > i0 else np.zeros(win)
-        rms = float(np.sqrt(np.mean(window ** 2)))
+        rms = math.sqrt(float(np.mean(window ** 2)))
         if len(window) >= 8:
             fft = np.fft.rfft(window * np.hanning(len(window)), n=FFT_SIZE)
             spec = np.abs(fft)
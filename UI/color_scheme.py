@@ -50,6 +50,9 @@ class JARVISColorScheme:
         self._transition_duration = 1.0
         self._previous_colors = {}
         
+        # Resolved (color_type, quantized alpha) -> RGBA for the settled mode
+        self._color_cache: Dict[Tuple[str, float], Tuple[float, float, float, float]] = {}
+        
         # Visual effect parameters
         self.holographic_settings = {
             'glow_intensity': 4.0,
@@ -92,6 +95,7 @@ class JARVISColorScheme:
             self._current_mode = mode
             self._transition_start_time = time.time()
             self._transition_duration = transition_time
+            self._color_cache.clear()
     
     def get_mode(self) -> str:
         """Get the current system mode."""
@@ -179,18 +183,23 @@ class JARVISColorScheme:
         Returns:
             RGBA color tuple
         """
-        current_colors = self._get_current_colors()
-        target_color = current_colors.get(color_type, self.palette.info_base)
-        
-        # Apply transition if in progress
+        # Apply transition if in progress; those colors change every frame
         progress = self._get_transition_progress()
         if progress < 1.0 and color_type in self._previous_colors:
+            target_color = self._get_current_colors().get(color_type, self.palette.info_base)
             previous_color = self._previous_colors[color_type]
             final_color = self._interpolate_color(previous_color, target_color, progress)
-        else:
-            final_color = target_color
+            return (*final_color, alpha)
         
-        return (*final_color, alpha)
+        # Settled colors only depend on the mode, so resolve each once; alpha is
+        # quantized to 1/128 steps to keep the cache small
+        key = (color_type, round(alpha * 128) / 128)
+        color = self._color_cache.get(key)
+        if color is None:
+            target_color = self._get_current_colors().get(color_type, self.palette.info_base)
+            color = (*target_color, key[1])
+            self._color_cache[key] = color
+        return color
     
     def get_dynamic_color(self, base_color_type: str, intensity: float = 1.0, 
                          time_offset: float = 0.0, alpha: float = 1.0) -> Tuple[float, float, float, float]:
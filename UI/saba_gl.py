@@ -11,8 +11,8 @@ from OpenGL.GLU import *
 from .models import SphereModel, LAT_STEPS, LON_STEPS, BASE_RADIUS
 from .audio_analyzer import AudioAnalyzer
 from .color_scheme import color_scheme
-from .visual_effects import geometric_patterns, holographic_effects, data_displays, particle_system
-from .typography import typography
+from .visual_effects import geometric_patterns, holographic_effects, data_displays, particle_system, overlay_pass
+from .typography import get_font
 from config.logger import get_logger
 
 logger = get_logger(__name__)
@@ -104,6 +104,9 @@ class SabaGL(QOpenGLWidget):
 
     def paintGL(self):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        
+        # One clock sample drives every effect animated in this frame
+        now = time.perf_counter()
 
         # Enhanced background with dynamic gradient
         self._draw_background_gradient()
@@ -123,7 +126,7 @@ class SabaGL(QOpenGLWidget):
         # Update color scheme based on current status
         if self._current_status == "Processing":
             color_scheme.set_mode("processing", 0.5)
-            global_intensity = max(global_intensity, 0.8 + math.sin(time.time() * 4.0) * 0.2)
+            global_intensity = max(global_intensity, 0.8 + math.sin(now * 4.0) * 0.2)
         elif self._current_status == "Listening":
             color_scheme.set_mode("listening", 0.5)
         elif self._current_status == "Playing Audio":
@@ -136,14 +139,14 @@ class SabaGL(QOpenGLWidget):
 
         # Enhanced sphere movement and breathing
         if rms > 0.02 or self._current_status == "Processing":
-            sway_x = math.sin(time.time() * 0.8) * rms * 0.15
-            sway_y = math.cos(time.time() * 0.6) * rms * 0.1
+            sway_x = math.sin(now * 0.8) * rms * 0.15
+            sway_y = math.cos(now * 0.6) * rms * 0.1
             glTranslatef(sway_x, sway_y, 0.0)
             
             # Enhanced breathing effect
             breath_scale = 1.0 + rms * 0.05
             if self._current_status == "Processing":
-                breath_scale += math.sin(time.time() * 3.0) * 0.02
+                breath_scale += math.sin(now * 3.0) * 0.02
             glScalef(breath_scale, breath_scale, breath_scale)
 
         # Enhanced multi-pass rendering for JARVIS-style sphere
@@ -199,41 +202,40 @@ class SabaGL(QOpenGLWidget):
             alpha=0.1
         )
         
-        # Draw holographic distortion effects
-        holographic_effects.draw_holographic_distortion(
-            (0, 0, 0), 
-            BASE_RADIUS, 
-            global_intensity
-        )
+        # Distortion rings and particles share one additive-blend overlay pass
+        with overlay_pass():
+            # Draw holographic distortion effects
+            holographic_effects.draw_holographic_distortion(
+                (0, 0, 0), 
+                BASE_RADIUS, 
+                global_intensity,
+                now=now
+            )
         
-        # Update and draw enhanced particle trails
-        particle_system.update_particles()
-        if rms > 0.05:  # Add varied particles during high activity
-            import random
-            for _ in range(int(rms * 8)):  # More particles for better effect
+            # Update and draw enhanced particle trails
+            particle_system.update_particles(now)
+            if rms > 0.05:  # Add varied particles during high activity
+                count = int(rms * 8)  # More particles for better effect
                 # Generate particles from sphere surface with magnetic field influence
-                angle1 = random.uniform(0, 2 * math.pi)
-                angle2 = random.uniform(0, math.pi)
+                angle1 = np.random.uniform(0, 2 * math.pi, count)
+                angle2 = np.random.uniform(0, math.pi, count)
                 
                 # Position on sphere surface
-                sphere_radius = BASE_RADIUS * random.uniform(0.8, 1.1)
-                pos = (
-                    sphere_radius * math.sin(angle2) * math.cos(angle1),
-                    sphere_radius * math.cos(angle2),
-                    sphere_radius * math.sin(angle2) * math.sin(angle1)
-                )
+                sphere_radius = BASE_RADIUS * np.random.uniform(0.8, 1.1, count)
+                pos = np.column_stack((
+                    sphere_radius * np.sin(angle2) * np.cos(angle1),
+                    sphere_radius * np.cos(angle2),
+                    sphere_radius * np.sin(angle2) * np.sin(angle1)
+                ))
                 
                 # Velocity with outward bias and some tangential component
-                vel_magnitude = random.uniform(0.3, 1.2) * rms
-                vel = (
-                    pos[0] * vel_magnitude * 0.5 + random.uniform(-0.3, 0.3),
-                    pos[1] * vel_magnitude * 0.3 + random.uniform(-0.2, 0.4),
-                    pos[2] * vel_magnitude * 0.5 + random.uniform(-0.3, 0.3)
-                )
+                vel_magnitude = np.random.uniform(0.3, 1.2, count) * rms
+                vel = (pos * vel_magnitude[:, None] * (0.5, 0.3, 0.5) +
+                       np.random.uniform((-0.3, -0.2, -0.3), (0.3, 0.4, 0.3), (count, 3)))
                 
-                particle_system.add_spark_particle(pos, vel, intensity=rms)
+                particle_system.add_spark_particles_bulk(pos, vel, intensity=rms, now=now)
         
-        particle_system.draw_particles()
+            particle_system.draw_particles(now)
 
         # Draw subtle background grid for depth
         self._draw_background_grid(effects)
@@ -1662,7 +1664,7 @@ class SabaGL(QOpenGLWidget):
         painter.drawRoundedRect(info_rect.adjusted(1, 1, -1, -1), 7, 7)
 
         # Crystal clear text rendering with enhanced typography
-        info_font = typography.get_font('body', 9)
+        info_font = get_font('body', 9)
         info_font.setWeight(QtGui.QFont.Normal)
         info_font.setHintingPreference(QtGui.QFont.PreferFullHinting)  # Superior text clarity
         info_font.setStyleStrategy(QtGui.QFont.PreferAntialias)
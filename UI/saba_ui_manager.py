@@ -22,7 +22,7 @@ class SpeechWorker(QThread):
     def run(self):
         """Run speech recognition in a separate thread."""
         try:
-            text = self.chat_service.speech_service.listen()
+            text = asyncio.run(self.chat_service.speech_service.listen())
             if text:
                 self.speech_recognized.emit(text)
             else:
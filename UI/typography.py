@@ -3,22 +3,46 @@ Advanced Typography System for JARVIS-style Interface
 Implements modern, geometric fonts with proper hierarchy and spacing.
 """
 
+import random
+from functools import cache, lru_cache
+from types import SimpleNamespace
 from typing import Dict, Any, Optional, Tuple
-from PyQt5.QtGui import QFont, QFontDatabase, QColor
+import numpy as np
+from PyQt5.QtGui import QFont, QFontDatabase, QFontMetrics, QColor
 from PyQt5.QtCore import Qt
 from .color_scheme import color_scheme
+from config.logger import get_logger
+
+logger = get_logger(__name__)
 
 class TypographyManager:
     """Manages font loading, styling, and text rendering for the JARVIS interface."""
     
+    # Preferred font families per category, in priority order
+    FALLBACK_FONTS = {
+        'primary': ('Orbitron', 'Rajdhani', 'Segoe UI', 'Arial'),
+        'secondary': ('Rajdhani', 'Exo 2', 'Segoe UI', 'Arial'),
+        'monospace': ('Consolas', 'Courier New', 'monospace'),
+        'display': ('Orbitron', 'Impact', 'Arial Black')
+    }
+    
+    # Text widths remembered per manager before the table is reset
+    ADVANCE_CACHE_SIZE = 512
+    
     def __init__(self):
         self.font_database = None
         self.loaded_fonts = {}
-        self.fallback_fonts = {
-            'primary': ['Orbitron', 'Rajdhani', 'Segoe UI', 'Arial'],
-            'secondary': ['Rajdhani', 'Exo 2', 'Segoe UI', 'Arial'],
-            'monospace': ['Consolas', 'Courier New', 'monospace'],
-            'display': ['Orbitron', 'Impact', 'Arial Black']
+        self._fallback_logged = False
+        self._fm_cache: Dict[str, QFontMetrics] = {}
+        self._line_heights: Dict[str, float] = {}
+        self._advances: Dict[Tuple[str, str], int] = {}
+        self._style_builders = {
+            'title': self._title_style,
+            'subtitle': self._subtitle_style,
+            'body': self._body_style,
+            'caption': self._caption_style,
+            'status': self._status_style,
+            'data': self._data_style
         }
         
         # Initialize fonts when needed (after QApplication is created)
@@ -28,14 +52,25 @@ class TypographyManager:
         if self.font_database is None:
             try:
                 self.font_database = QFontDatabase()
-                self._initialize_fonts()
-            except:
-                # Fallback initialization if QApplication not ready
-                self.font_database = None
-                self._set_fallback_fonts()
+            except (RuntimeError, ImportError) as e:
+                # Fallback fonts until the QApplication is ready; set once so the
+                # metric caches survive the retries on later calls
+                if not self._fallback_logged:
+                    logger.warning(f"Font database unavailable, using fallback fonts: {e}")
+                    self._fallback_logged = True
+                    self._set_fallback_fonts()
+                return
+            self._initialize_fonts()
+    
+    def _invalidate_metrics(self):
+        """Drop cached font metrics after the font families change."""
+        self._fm_cache.clear()
+        self._line_heights.clear()
+        self._advances.clear()
     
     def _set_fallback_fonts(self):
         """Set fallback fonts when QFontDatabase is not available."""
+        self._invalidate_metrics()
         self.loaded_fonts = {
             'primary': 'Arial',
             'secondary': 'Arial',
@@ -48,12 +83,14 @@ class TypographyManager:
         if self.font_database is None:
             self._set_fallback_fonts()
             return
+        
+        self._invalidate_metrics()
             
         # Get all available system fonts
         available_families = self.font_database.families()
         
         # Check which preferred fonts are available
-        for category, font_list in self.fallback_fonts.items():
+        for category, font_list in self.FALLBACK_FONTS.items():
             for font_name in font_list:
                 if font_name in available_families:
                     self.loaded_fonts[category] = font_name
@@ -129,64 +166,69 @@ class TypographyManager:
         Returns:
             Dictionary containing font and color information
         """
-        if text_type == 'title':
-            return {
-                'font': self.get_title_font(28),
-                'color': self._get_text_color('primary', 0.95),
-                'shadow': True,
-                'shadow_color': self._get_text_color('glow', 0.3),
-                'letter_spacing': 3.0,
-                'line_height': 1.2
-            }
-        
-        elif text_type == 'subtitle':
-            return {
-                'font': self.get_subtitle_font(18),
-                'color': self._get_text_color('secondary', 0.85),
-                'shadow': False,
-                'letter_spacing': 2.0,
-                'line_height': 1.3
-            }
-        
-        elif text_type == 'body':
-            return {
-                'font': self.get_body_font(14),
-                'color': self._get_text_color('primary', 0.8),
-                'shadow': False,
-                'letter_spacing': 0.5,
-                'line_height': 1.4
-            }
-        
-        elif text_type == 'caption':
-            return {
-                'font': self.get_caption_font(11),
-                'color': self._get_text_color('secondary', 0.6),
-                'shadow': False,
-                'letter_spacing': 1.0,
-                'line_height': 1.3
-            }
-        
-        elif text_type == 'status':
-            return {
-                'font': self.get_status_font(10),
-                'color': self._get_text_color('accent', 0.9),
-                'shadow': True,
-                'shadow_color': self._get_text_color('glow', 0.2),
-                'letter_spacing': 2.5,
-                'line_height': 1.0
-            }
-        
-        elif text_type == 'data':
-            return {
-                'font': self.get_mono_font(12),
-                'color': self._get_text_color('accent', 0.85),
-                'shadow': False,
-                'letter_spacing': 0.8,
-                'line_height': 1.2
-            }
-        
-        else:  # Default to body
-            return self.create_text_style('body')
+        return self._style_builders.get(text_type, self._body_style)()
+    
+    def _title_style(self) -> Dict[str, Any]:
+        """Style for main titles and headers."""
+        return {
+            'font': self.get_title_font(28),
+            'color': self._get_text_color('primary', 0.95),
+            'shadow': True,
+            'shadow_color': self._get_text_color('glow', 0.3),
+            'letter_spacing': 3.0,
+            'line_height': 1.2
+        }
+    
+    def _subtitle_style(self) -> Dict[str, Any]:
+        """Style for subtitles and secondary headers."""
+        return {
+            'font': self.get_subtitle_font(18),
+            'color': self._get_text_color('secondary', 0.85),
+            'shadow': False,
+            'letter_spacing': 2.0,
+            'line_height': 1.3
+        }
+    
+    def _body_style(self) -> Dict[str, Any]:
+        """Style for body text."""
+        return {
+            'font': self.get_body_font(14),
+            'color': self._get_text_color('primary', 0.8),
+            'shadow': False,
+            'letter_spacing': 0.5,
+            'line_height': 1.4
+        }
+    
+    def _caption_style(self) -> Dict[str, Any]:
+        """Style for captions and small text."""
+        return {
+            'font': self.get_caption_font(11),
+            'color': self._get_text_color('secondary', 0.6),
+            'shadow': False,
+            'letter_spacing': 1.0,
+            'line_height': 1.3
+        }
+    
+    def _status_style(self) -> Dict[str, Any]:
+        """Style for status indicators."""
+        return {
+            'font': self.get_status_font(10),
+            'color': self._get_text_color('accent', 0.9),
+            'shadow': True,
+            'shadow_color': self._get_text_color('glow', 0.2),
+            'letter_spacing': 2.5,
+            'line_height': 1.0
+        }
+    
+    def _data_style(self) -> Dict[str, Any]:
+        """Style for monospace data readouts."""
+        return {
+            'font': self.get_mono_font(12),
+            'color': self._get_text_color('accent', 0.85),
+            'shadow': False,
+            'letter_spacing': 0.8,
+            'line_height': 1.2
+        }
     
     def _get_text_color(self, color_type: str, alpha: float) -> QColor:
         """Convert color scheme colors to QColor objects."""
@@ -228,93 +270,172 @@ class TypographyManager:
         Returns:
             Dictionary with width, height, and other metrics
         """
-        style = self.create_text_style(style_type)
-        font = style['font']
-        
-        from PyQt5.QtGui import QFontMetrics
-        metrics = QFontMetrics(font)
+        metrics = self._font_metrics(style_type)
         
         return {
-            'width': metrics.horizontalAdvance(text),
+            'width': self._advance(style_type, text),
             'height': metrics.height(),
             'ascent': metrics.ascent(),
             'descent': metrics.descent(),
             'leading': metrics.leading(),
-            'line_spacing': int(metrics.height() * style.get('line_height', 1.4))
+            'line_spacing': int(metrics.height() * self._line_heights[style_type])
         }
+    
+    def _font_metrics(self, style_type: str) -> QFontMetrics:
+        """Return the cached QFontMetrics for a style, building it on first use."""
+        metrics = self._fm_cache.get(style_type)
+        if metrics is None:
+            style = self.create_text_style(style_type)
+            metrics = QFontMetrics(style['font'])
+            self._fm_cache[style_type] = metrics
+            self._line_heights[style_type] = style.get('line_height', 1.4)
+        return metrics
+    
+    def _advance(self, style_type: str, text: str) -> int:
+        """Memoized horizontal advance of text in the given style."""
+        key = (style_type, text)
+        width = self._advances.get(key)
+        if width is None:
+            if len(self._advances) >= self.ADVANCE_CACHE_SIZE:
+                self._advances.clear()
+            width = self._font_metrics(style_type).horizontalAdvance(text)
+            self._advances[key] = width
+        return width
 
-class TextAnimations:
-    """Text animation effects for dynamic text displays."""
+@lru_cache(maxsize=32)
+def _prefixes(text: str) -> Tuple[str, ...]:
+    """All prefixes of text, indexed by length, shared across animation frames."""
+    return tuple(text[:i] for i in range(len(text) + 1))
+
+@lru_cache(maxsize=64)
+def _block(char: str, count: int) -> str:
+    """Repeated block-character run, cached per (char, count)."""
+    return char * count
+
+def typing_effect(text: str, progress: float) -> str:
+    """Simulate typing effect by revealing characters progressively."""
+    if progress <= 0:
+        return ""
+    if progress >= 1:
+        return text
     
-    @staticmethod
-    def typing_effect(text: str, progress: float) -> str:
-        """Simulate typing effect by revealing characters progressively."""
-        if progress <= 0:
-            return ""
-        if progress >= 1:
-            return text
-        
-        visible_chars = int(len(text) * progress)
-        return text[:visible_chars]
-    
-    @staticmethod
-    def scan_effect(text: str, progress: float, scan_char: str = '█') -> str:
-        """Simulate scanning effect with a block character."""
-        if progress <= 0:
-            return scan_char * len(text)
-        if progress >= 1:
-            return text
-        
-        visible_chars = int(len(text) * progress)
-        result = text[:visible_chars]
-        
-        # Add scanning block for remaining characters
-        remaining = len(text) - visible_chars
-        if remaining > 0:
-            result += scan_char * min(3, remaining)
-        
-        return result
+    return _prefixes(text)[int(len(text) * progress)]
+
+def scan_effect(text: str, progress: float, scan_char: str = '█') -> str:
+    """Simulate scanning effect with a block character."""
+    if progress <= 0:
+        return _block(scan_char, len(text))
+    if progress >= 1:
+        return text
     
-    @staticmethod
-    def glitch_effect(text: str, intensity: float = 0.1) -> str:
-        """Add glitch effect by randomly replacing some characters."""
-        if intensity <= 0:
-            return text
-        
-        import random
-        glitch_chars = '█▓▒░▄▀▐▌'
-        result = list(text)
-        
-        for i in range(len(result)):
-            if random.random() < intensity:
-                result[i] = random.choice(glitch_chars)
-        
-        return ''.join(result)
+    visible_chars = int(len(text) * progress)
+    result = _prefixes(text)[visible_chars]
     
-    @staticmethod
-    def decode_effect(text: str, progress: float) -> str:
-        """Simulate decoding effect where characters resolve over time."""
-        if progress >= 1:
-            return text
-        
-        import random
-        decode_chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*'
-        result = []
-        
-        for i, char in enumerate(text):
-            char_progress = max(0, progress * 2 - (i / len(text)))
-            if char_progress >= 1:
+    # Add scanning block for remaining characters
+    remaining = len(text) - visible_chars
+    if remaining > 0:
+        result += _block(scan_char, min(3, remaining))
+    
+    return result
+
+def glitch_effect(text: str, intensity: float = 0.1) -> str:
+    """Add glitch effect by randomly replacing some characters."""
+    if intensity <= 0:
+        return text
+    
+    glitch_chars = '█▓▒░▄▀▐▌'
+    
+    # Sample how many characters glitch, then touch only those positions
+    count = np.random.binomial(len(text), min(1.0, intensity))
+    if count == 0:
+        return text
+    
+    positions = np.random.randint(0, len(text), count)
+    choices = np.random.randint(0, len(glitch_chars), count)
+    result = list(text)
+    for pos, choice in zip(positions, choices):
+        result[pos] = glitch_chars[choice]
+    
+    return ''.join(result)
+
+def decode_effect(text: str, progress: float) -> str:
+    """Simulate decoding effect where characters resolve over time."""
+    if progress >= 1:
+        return text
+    
+    decode_chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*'
+    result = []
+    
+    for i, char in enumerate(text):
+        char_progress = max(0, progress * 2 - (i / len(text)))
+        if char_progress >= 1:
+            result.append(char)
+        elif char_progress > 0:
+            if random.random() < char_progress:
                 result.append(char)
-            elif char_progress > 0:
-                if random.random() < char_progress:
-                    result.append(char)
-                else:
-                    result.append(random.choice(decode_chars))
             else:
                 result.append(random.choice(decode_chars))
-        
-        return ''.join(result)
+        else:
+            result.append(random.choice(decode_chars))
+    
+    return ''.join(result)
+
+class TextAnimations:
+    """Text animation effects for dynamic text displays."""
+    
+    typing_effect = staticmethod(typing_effect)
+    scan_effect = staticmethod(scan_effect)
+    glitch_effect = staticmethod(glitch_effect)
+    decode_effect = staticmethod(decode_effect)
+
+@cache
+def _manager() -> TypographyManager:
+    """Return the shared TypographyManager; it loads its fonts on first use."""
+    return TypographyManager()
+
+def get_font(style_type: str = 'primary', 
+             size: int = 12, 
+             weight: int = QFont.Normal,
+             italic: bool = False) -> QFont:
+    """Get a configured QFont from the shared typography manager."""
+    return _manager().get_font(style_type, size, weight, italic)
+
+def get_title_font(size: int = 24) -> QFont:
+    return _manager().get_title_font(size)
+
+def get_subtitle_font(size: int = 16) -> QFont:
+    return _manager().get_subtitle_font(size)
+
+def get_body_font(size: int = 12) -> QFont:
+    return _manager().get_body_font(size)
+
+def get_caption_font(size: int = 10) -> QFont:
+    return _manager().get_caption_font(size)
+
+def get_mono_font(size: int = 11) -> QFont:
+    return _manager().get_mono_font(size)
+
+def get_status_font(size: int = 10) -> QFont:
+    return _manager().get_status_font(size)
+
+def create_text_style(text_type: str = 'body') -> Dict[str, Any]:
+    return _manager().create_text_style(text_type)
+
+def get_text_metrics(text: str, style_type: str = 'body') -> Dict[str, int]:
+    return _manager().get_text_metrics(text, style_type)
+
+class _LazyTypography:
+    """Attribute proxy to the shared manager, kept for `typography.<attr>` callers."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_manager(), name)
 
 # Global typography manager instance
-typography = TypographyManager()
-text_animations = TextAnimations()
+typography = _LazyTypography()
+# Plain namespace so attribute access yields the functions without descriptor dispatch
+text_animations = SimpleNamespace(
+    typing_effect=typing_effect,
+    scan_effect=scan_effect,
+    glitch_effect=glitch_effect,
+    decode_effect=decode_effect
+)
@@ -3,13 +3,326 @@ Advanced Visual Effects System for JARVIS-style Interface
 Implements geometric patterns, wireframes, holographic effects, and dynamic data displays.
 """
 
+import ctypes
 import math
 import time
 import numpy as np
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 from OpenGL.GL import *
+from OpenGL.GL import shaders
+from OpenGL.error import Error as OpenGLError
 from OpenGL.GLU import *
 from .color_scheme import color_scheme
+from config.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Scalar trig: use `math`. Array trig: use `np`.
+# NumPy ufuncs carry per-call dispatch overhead that dwarfs the work for a
+# single float, so per-frame scalars (phases, angles, one-off distances) stay
+# on `math`, and `np` is reserved for whole vertex/particle arrays.
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # Optional accelerator; the NumPy integrator is used instead
+    HAS_NUMBA = False
+
+# Static vertex buffers keyed by (shape, segments): (buffer id, vertex count)
+_VBOCache: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+# Unit-circle (cos, sin) tables for the segment counts used by the effects
+_UNIT_CIRCLE: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+def _unit_circle(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return cos/sin of 2*pi*k/n for k in range(n), computed once per n."""
+    table = _UNIT_CIRCLE.get(n)
+    if table is None:
+        angles = 2 * np.pi * np.arange(n) / n
+        table = (np.cos(angles).astype(np.float32), np.sin(angles).astype(np.float32))
+        _UNIT_CIRCLE[n] = table
+    return table
+
+for _n in (3, 6, 24, 32, 48):
+    _unit_circle(_n)
+
+# Sine lookup table for per-frame animated geometry; the power-of-two size
+# lets angle steps wrap with a bit mask instead of a modulo
+_LUT_SIZE = 1024
+_LUT_MASK = _LUT_SIZE - 1
+_LUT_SCALE = _LUT_SIZE / (2 * math.pi)
+_SIN_LUT = np.sin(2 * np.pi * np.arange(_LUT_SIZE) / _LUT_SIZE).astype(np.float32)
+
+def _xz_loop(cos_t: np.ndarray, sin_t: np.ndarray, y: float = 0.0) -> np.ndarray:
+    """Interleave XZ-plane coordinates into an (n, 3) float32 vertex array."""
+    verts = np.empty((len(cos_t), 3), dtype=np.float32)
+    verts[:, 0] = cos_t
+    verts[:, 1] = y
+    verts[:, 2] = sin_t
+    return verts
+
+def _build_hexagon(_segments: int) -> np.ndarray:
+    """Unit hexagon outline in the XZ plane."""
+    return _xz_loop(*_unit_circle(6))
+
+def _build_hexagon_spokes(_segments: int) -> np.ndarray:
+    """Line pairs from the origin to each unit hexagon corner."""
+    verts = np.zeros((12, 3), dtype=np.float32)
+    verts[1::2] = _build_hexagon(6)
+    return verts
+
+def _build_hex_grid(layers: int) -> np.ndarray:
+    """Concentric hexagons scaled 1..layers, followed by the unit spokes."""
+    hexagon = _build_hexagon(6)
+    scales = np.arange(1, layers + 1, dtype=np.float32)[:, None, None]
+    rings = (hexagon[None] * scales).reshape(-1, 3)
+    return np.concatenate([rings, _build_hexagon_spokes(6)])
+
+def _build_triangle(_segments: int) -> np.ndarray:
+    """Unit triangle outline in the XZ plane, pointing along +Z."""
+    cos_t, sin_t = _unit_circle(3)
+    # Rotating by pi/2: cos(a + pi/2) = -sin(a), sin(a + pi/2) = cos(a)
+    return _xz_loop(-sin_t, cos_t)
+
+def _build_ring(segments: int) -> np.ndarray:
+    """Unit circle outline in the XZ plane."""
+    return _xz_loop(*_unit_circle(segments))
+
+def _build_sphere_latitudes(segments: int) -> np.ndarray:
+    """Unit sphere latitude loops as (rings, 2, segments, 3): a +y and a -y loop per ring."""
+    cos_t, sin_t = _unit_circle(segments)
+    rings = segments // 4
+    lat_angles = np.pi * np.arange(1, rings + 1) / (segments // 2)
+    lat_radius = np.sin(lat_angles)[:, None]
+    y_pos = np.cos(lat_angles)[:, None]
+    
+    verts = np.empty((rings, 2, segments, 3), dtype=np.float32)
+    verts[:, :, :, 0] = (lat_radius * cos_t)[:, None, :]
+    verts[:, 0, :, 1] = y_pos
+    verts[:, 1, :, 1] = -y_pos
+    verts[:, :, :, 2] = (lat_radius * sin_t)[:, None, :]
+    return verts
+
+def _build_sphere_longitudes(segments: int) -> np.ndarray:
+    """Unit sphere longitude strips, one run of segments + 1 vertices per strip."""
+    cos_lon, sin_lon = _unit_circle(segments)
+    cos_lon, sin_lon = cos_lon[:segments // 2, None], sin_lon[:segments // 2, None]
+    lat_angles = np.pi * np.arange(segments + 1) / segments
+    sin_lat, cos_lat = np.sin(lat_angles), np.cos(lat_angles)
+    
+    verts = np.empty((segments // 2, segments + 1, 3), dtype=np.float32)
+    verts[:, :, 0] = sin_lat * cos_lon
+    verts[:, :, 1] = cos_lat
+    verts[:, :, 2] = sin_lat * sin_lon
+    return verts.reshape(-1, 3)
+
+def _build_sphere_mesh(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Unit wireframe sphere: latitude loops then longitude strips, with GL_LINES indices."""
+    rings = segments // 4
+    strips = segments // 2
+    lat = _build_sphere_latitudes(segments).reshape(-1, 3)
+    lon = _build_sphere_longitudes(segments)
+    
+    # Closed loops connect k -> k+1 with wrap-around; open strips do not wrap
+    loop = np.arange(segments)
+    loop_starts = (np.arange(2 * rings) * segments)[:, None]
+    lat_edges = np.stack([loop_starts + loop, loop_starts + (loop + 1) % segments], axis=-1)
+    
+    strip = np.arange(segments)
+    strip_starts = (len(lat) + np.arange(strips) * (segments + 1))[:, None]
+    lon_edges = np.stack([strip_starts + strip, strip_starts + strip + 1], axis=-1)
+    
+    indices = np.concatenate([lat_edges.ravel(), lon_edges.ravel()]).astype(np.uint16)
+    return np.concatenate([lat, lon]), indices
+
+# Indexed sphere meshes keyed by segments: (vertex buffer, index buffer, index count)
+_SphereMeshCache: Dict[int, Tuple[int, int, int]] = {}
+
+def _sphere_mesh(segments: int) -> Tuple[int, int, int]:
+    """Return the indexed wireframe sphere buffers, uploading them on first use."""
+    entry = _SphereMeshCache.get(segments)
+    if entry is None:
+        verts, indices = _build_sphere_mesh(segments)
+        vbo = glGenBuffers(1)
+        ibo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        entry = (vbo, ibo, len(indices))
+        _SphereMeshCache[segments] = entry
+    return entry
+
+_SHAPE_BUILDERS = {
+    'hex_grid': _build_hex_grid,
+    'triangle': _build_triangle,
+    'ring': _build_ring,
+}
+
+def _static_vbo(shape: str, segments: int = 0) -> int:
+    """Return the buffer id for a unit shape, uploading it on first use."""
+    key = (shape, segments)
+    entry = _VBOCache.get(key)
+    if entry is None:
+        verts = _SHAPE_BUILDERS[shape](segments)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        entry = (vbo, len(verts))
+        _VBOCache[key] = entry
+    return entry[0]
+
+def _bind_vertices(vbo: int):
+    """Bind a static buffer as the current vertex array."""
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, None)
+
+def _draw_client_array(mode, verts: np.ndarray):
+    """Draw a per-frame vertex array straight from client memory."""
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(verts.shape[1], GL_FLOAT, 0, verts)
+    glDrawArrays(mode, 0, len(verts))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+def _unbind_vertices():
+    """Release the vertex array bound by _bind_vertices."""
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+# Interleaved (x, y, z, r, g, b, a) float32 vertices for dynamic buffers
+_COLORED_STRIDE = 7 * 4
+
+def _dynamic_vbo(nbytes: int) -> int:
+    """Allocate a buffer that is refilled every frame."""
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, nbytes, None, GL_DYNAMIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vbo
+
+def _bind_colored(vbo: int, buf: np.ndarray):
+    """Upload interleaved position/color vertices and bind them for drawing."""
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferSubData(GL_ARRAY_BUFFER, 0, buf.nbytes, buf)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(3, GL_FLOAT, _COLORED_STRIDE, ctypes.c_void_p(0))
+    glColorPointer(4, GL_FLOAT, _COLORED_STRIDE, ctypes.c_void_p(12))
+
+def _unbind_colored():
+    """Release the arrays bound by _bind_colored."""
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+def _rotation_matrix(angle: float, axis: Tuple[float, float, float]) -> np.ndarray:
+    """3x3 rotation matching glRotatef(angle, *axis)."""
+    x, y, z = axis
+    norm = math.sqrt(x * x + y * y + z * z)
+    x, y, z = x / norm, y / norm, z / norm
+    c = math.cos(math.radians(angle))
+    s = math.sin(math.radians(angle))
+    t = 1.0 - c
+    return np.array([
+        [t * x * x + c,     t * x * y - s * z, t * x * z + s * y],
+        [t * x * y + s * z, t * y * y + c,     t * y * z - s * x],
+        [t * x * z - s * y, t * y * z + s * x, t * z * z + c]
+    ], dtype=np.float32)
+
+@lru_cache(maxsize=16)
+def _ring_edges(segments: int, skip: int) -> np.ndarray:
+    """GL_LINES vertex indices for a ring.
+    
+    skip < 0 gives a closed loop; otherwise the ring is split into six
+    strips and every third one, offset by skip, is left out.
+    """
+    if skip < 0:
+        start = np.arange(segments)
+        return np.stack([start, (start + 1) % segments], axis=-1).ravel()
+    groups = 6
+    group_size = segments // groups
+    visible = [g for g in range(groups) if (g + skip) % 3 != 0]
+    start = (np.array(visible)[:, None] * group_size + np.arange(group_size - 1)).ravel()
+    return np.stack([start, start + 1], axis=-1).ravel()
+
+@dataclass(frozen=True)
+class AnimatedRing:
+    """One ring of an animated ring batch, see HolographicEffects.draw_animated_rings."""
+    radius: float
+    color: Tuple[float, float, float, float]
+    segments: int = 24
+    phase: float = 0.0       # Drives the distortion wobble and the broken-segment pattern
+    distortion: float = 0.0  # Radial wobble amplitude; the height wobble is 3x this
+    spin: float = 0.0        # Degrees about Y
+    tilt: float = 0.0        # Degrees about (1, 0, 1), applied before the spin
+    broken: bool = False     # Drop every third of six segment groups
+
+class _GLState:
+    """Shadow copy of the depth/blend state the effects toggle, to skip redundant calls.
+    
+    The shadow is only trusted inside overlay(); outside it every setter
+    reaches GL because other code may have changed the state in between.
+    """
+    
+    def __init__(self):
+        self._nesting = 0
+        self._invalidate()
+    
+    def _invalidate(self):
+        self._depth_test = None
+        self._blend = None
+        self._blend_func = None
+    
+    def set_depth_test(self, enabled: bool):
+        if self._nesting and self._depth_test == enabled:
+            return
+        (glEnable if enabled else glDisable)(GL_DEPTH_TEST)
+        self._depth_test = enabled
+    
+    def set_blend(self, src=GL_SRC_ALPHA, dst=GL_ONE_MINUS_SRC_ALPHA):
+        """Enable blending with the given blend function."""
+        if not (self._nesting and self._blend):
+            glEnable(GL_BLEND)
+            self._blend = True
+        if not (self._nesting and self._blend_func == (src, dst)):
+            glBlendFunc(src, dst)
+            self._blend_func = (src, dst)
+    
+    def _apply_defaults(self):
+        self.set_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self.set_depth_test(True)
+    
+    def restore(self):
+        """Return to the default 3D state, deferred to the end of an overlay pass."""
+        if not self._nesting:
+            self._apply_defaults()
+    
+    @contextmanager
+    def overlay(self):
+        """Share GL state across consecutive effect draws, restoring it once at the end."""
+        if self._nesting == 0:
+            self._invalidate()
+        self._nesting += 1
+        try:
+            yield self
+        finally:
+            if self._nesting == 1:
+                self._apply_defaults()
+            self._nesting -= 1
+
+_gl_state = _GLState()
+
+def overlay_pass():
+    """Context manager for drawing several effects back to back, e.g.
+    distortion rings then particles, with a single state setup/restore."""
+    return _gl_state.overlay()
 
 class GeometricPatterns:
     """Generator for geometric patterns and wireframe overlays."""
@@ -26,38 +339,40 @@ class GeometricPatterns:
         glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
         glLineWidth(0.8)
         
-        color = color_scheme.get_color('accent', alpha * 0.3)
-        glColor4f(*color)
-        
         cx, cy, cz = center
         hex_radius = radius / (layers + 1)
         
-        for layer in range(1, layers + 1):
-            layer_radius = hex_radius * layer
-            layer_alpha = alpha * (1.0 - layer * 0.2)
-            
-            color = color_scheme.get_color('accent', layer_alpha)
-            glColor4f(*color)
-            
-            # Draw hexagon
-            glBegin(GL_LINE_LOOP)
-            for i in range(6):
-                angle = i * math.pi / 3
-                x = cx + layer_radius * math.cos(angle)
-                z = cz + layer_radius * math.sin(angle)
-                glVertex3f(x, cy, z)
-            glEnd()
-            
-            # Draw connecting lines to center for inner layers
-            if layer == 1:
-                glBegin(GL_LINES)
-                for i in range(6):
-                    angle = i * math.pi / 3
-                    x = cx + layer_radius * math.cos(angle)
-                    z = cz + layer_radius * math.sin(angle)
-                    glVertex3f(cx, cy, cz)
-                    glVertex3f(x, cy, z)
-                glEnd()
+        # Per-vertex colors: each hexagon fades with its layer, the spokes
+        # share the innermost layer's color
+        layer_colors = np.array([
+            color_scheme.get_color('accent', alpha * (1.0 - layer * 0.2))
+            for layer in range(1, layers + 1)
+        ], dtype=np.float32)
+        colors = np.concatenate([
+            np.repeat(layer_colors, 6, axis=0),
+            np.repeat(layer_colors[:1], 12, axis=0)
+        ])
+        firsts = np.arange(layers, dtype=np.int32) * 6
+        counts = np.full(layers, 6, dtype=np.int32)
+        
+        glPushMatrix()
+        glTranslatef(cx, cy, cz)
+        glScalef(hex_radius, 1.0, hex_radius)
+        
+        # Positions come from the static buffer; unbind it before pointing the
+        # color array at client memory
+        _bind_vertices(_static_vbo('hex_grid', layers))
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(4, GL_FLOAT, 0, colors)
+        
+        # All hexagon outlines in one call, then the connecting lines to center
+        glMultiDrawArrays(GL_LINE_LOOP, firsts, counts, layers)
+        glDrawArrays(GL_LINES, layers * 6, 12)
+        
+        glDisableClientState(GL_COLOR_ARRAY)
+        _unbind_vertices()
+        glPopMatrix()
     
     @staticmethod
     def draw_triangular_pattern(center: Tuple[float, float, float], 
@@ -80,6 +395,7 @@ class GeometricPatterns:
         glRotatef(rotation, 0, 1, 0)
         
         # Draw nested triangles
+        _bind_vertices(_static_vbo('triangle'))
         for scale in [1.0, 0.6, 0.3]:
             s = size * scale
             triangle_alpha = alpha * scale
@@ -87,13 +403,11 @@ class GeometricPatterns:
             color = color_scheme.get_color('secondary', triangle_alpha)
             glColor4f(*color)
             
-            glBegin(GL_LINE_LOOP)
-            for i in range(3):
-                angle = i * 2 * math.pi / 3 + math.pi / 2
-                x = s * math.cos(angle)
-                z = s * math.sin(angle)
-                glVertex3f(x, 0, z)
-            glEnd()
+            glPushMatrix()
+            glScalef(s, 1.0, s)
+            glDrawArrays(GL_LINE_LOOP, 0, 3)
+            glPopMatrix()
+        _unbind_vertices()
         
         glPopMatrix()
     
@@ -112,41 +426,29 @@ class GeometricPatterns:
         
         glPushMatrix()
         glTranslatef(cx, cy, cz)
+        glScalef(radius, radius, radius)
         
-        # Latitude lines
-        for i in range(segments // 4):
-            lat_angle = math.pi * (i + 1) / (segments // 2)
-            lat_radius = radius * math.sin(lat_angle)
-            y_pos = radius * math.cos(lat_angle)
-            
-            fade = 1.0 - abs(i - segments // 8) / (segments // 8)
-            color = color_scheme.get_color('primary', alpha * fade)
-            glColor4f(*color)
-            
-            glBegin(GL_LINE_LOOP)
-            for j in range(segments):
-                angle = 2 * math.pi * j / segments
-                x = lat_radius * math.cos(angle)
-                z = lat_radius * math.sin(angle)
-                glVertex3f(x, y_pos, z)
-                glVertex3f(x, -y_pos, z)
-            glEnd()
-        
-        # Longitude lines
-        for i in range(segments // 2):
-            lon_angle = 2 * math.pi * i / segments
-            
-            color = color_scheme.get_color('primary', alpha * 0.7)
-            glColor4f(*color)
-            
-            glBegin(GL_LINE_STRIP)
-            for j in range(segments + 1):
-                lat_angle = math.pi * j / segments
-                x = radius * math.sin(lat_angle) * math.cos(lon_angle)
-                y = radius * math.cos(lat_angle)
-                z = radius * math.sin(lat_angle) * math.sin(lon_angle)
-                glVertex3f(x, y, z)
-            glEnd()
+        # Per-vertex alpha: latitude rings fade toward the poles and equator
+        # bands, longitudes share one alpha
+        rings = segments // 4
+        fade = 1.0 - np.abs(np.arange(rings) - segments // 8) / (segments // 8)
+        lat_alpha = np.repeat(alpha * fade, 2 * segments)
+        lon_alpha = np.full((segments // 2) * (segments + 1), alpha * 0.7)
+        colors = np.empty((len(lat_alpha) + len(lon_alpha), 4), dtype=np.float32)
+        colors[:, :3] = color_scheme.get_color('primary')[:3]
+        colors[:, 3] = np.concatenate([lat_alpha, lon_alpha])
+        
+        # One indexed draw for all latitude and longitude lines
+        vbo, ibo, index_count = _sphere_mesh(segments)
+        _bind_vertices(vbo)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(4, GL_FLOAT, 0, colors)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glDrawElements(GL_LINES, index_count, GL_UNSIGNED_SHORT, None)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        _unbind_vertices()
         
         glPopMatrix()
 
@@ -158,12 +460,39 @@ class HolographicEffects:
         self.distortion_enabled = True
         self.glow_enabled = True
         
+        # Scan-line vertex buffer, rebuilt only when the viewport or spacing changes
+        self._scan_key = None
+        self._scan_vbo = None
+        self._scan_count = 0
+        
+        # Growable dynamic buffer for draw_animated_rings
+        self._ring_vbo = None
+        self._ring_capacity = 0
+        
+    def _scan_line_buffer(self, width: int, height: int, spacing: float) -> int:
+        """Return the scan-line buffer for this viewport, rebuilding it on change."""
+        key = (width, height, spacing)
+        if key != self._scan_key:
+            ys = np.arange(0, height, spacing, dtype=np.float32)
+            verts = np.zeros((len(ys), 2, 2), dtype=np.float32)
+            verts[:, 1, 0] = width
+            verts[:, :, 1] = ys[:, None]
+            
+            if self._scan_vbo is None:
+                self._scan_vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self._scan_vbo)
+            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            self._scan_key = key
+            self._scan_count = 2 * len(ys)
+        return self._scan_vbo
+        
     def draw_scan_lines(self, width: int, height: int):
         """Draw CRT-style scan lines overlay."""
         if not self.scan_lines_enabled:
             return
             
-        glDisable(GL_DEPTH_TEST)
+        _gl_state.set_depth_test(False)
         
         # Save matrices
         glMatrixMode(GL_PROJECTION)
@@ -175,8 +504,7 @@ class HolographicEffects:
         glPushMatrix()
         glLoadIdentity()
         
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        _gl_state.set_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         
         scan_params = color_scheme.apply_scan_lines(True)
         if scan_params['enabled']:
@@ -185,15 +513,16 @@ class HolographicEffects:
             color = scan_params['color']
             
             glColor4f(*color)
-            glBegin(GL_LINES)
-            
-            y = offset % spacing
-            while y < height:
-                glVertex2f(0, y)
-                glVertex2f(width, y)
-                y += spacing
             
-            glEnd()
+            # The cached lines start at y=0; the scrolling offset is a translation
+            # and lines pushed past the top edge are clipped by the projection
+            vbo = self._scan_line_buffer(width, height, spacing)
+            glTranslatef(0, offset % spacing, 0)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, None)
+            glDrawArrays(GL_LINES, 0, self._scan_count)
+            _unbind_vertices()
         
         # Restore matrices
         glPopMatrix()
@@ -201,25 +530,25 @@ class HolographicEffects:
         glPopMatrix()
         glMatrixMode(GL_MODELVIEW)
         
-        glEnable(GL_DEPTH_TEST)
+        _gl_state.restore()
     
     def draw_holographic_distortion(self, center: Tuple[float, float, float], 
                                    radius: float, 
-                                   intensity: float = 1.0):
+                                   intensity: float = 1.0,
+                                   now: Optional[float] = None):
         """Draw holographic distortion effects around objects."""
         if not self.distortion_enabled:
             return
-            
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)  # Additive blending for glow
-        
-        cx, cy, cz = center
-        current_time = time.time()
+        self.draw_animated_rings(center, self.distortion_rings(radius, intensity, now))
+    
+    def distortion_rings(self, radius: float, intensity: float = 1.0,
+                         now: Optional[float] = None) -> List[AnimatedRing]:
+        """Ring specs for the holographic distortion effect at frame time `now`."""
+        current_time = time.perf_counter() if now is None else now
+        rings = []
         
         # Multiple distortion rings
         for i in range(3):
-            ring_radius = radius * (1.3 + i * 0.4)
             ring_speed = 0.5 + i * 0.2
             ring_phase = current_time * ring_speed + i * 2.0
             
@@ -227,83 +556,99 @@ class HolographicEffects:
             fade = 1.0 / (1.0 + i * 0.5)
             alpha = 0.1 * intensity * fade
             
-            color = color_scheme.get_dynamic_color('glow', intensity, ring_phase, alpha)
-            glColor4f(*color)
-            
-            glPushMatrix()
-            glTranslatef(cx, cy, cz)
-            glRotatef(ring_phase * 20, 0, 1, 0)
-            glRotatef(10 + i * 15, 1, 0, 1)
-            
-            # Draw distorted ring segments
-            segments = 32
-            segment_groups = 6
-            segment_size = segments // segment_groups
-            
-            for group in range(segment_groups):
-                # Skip some segments for broken/distorted look
-                if (group + int(ring_phase)) % 3 == 0:
-                    continue
-                    
-                glBegin(GL_LINE_STRIP)
-                start_idx = group * segment_size
-                for j in range(segment_size):
-                    idx = start_idx + j
-                    angle = 2 * math.pi * idx / segments
-                    
-                    # Add distortion
-                    distortion = math.sin(angle * 4 + ring_phase) * 0.1
-                    r = ring_radius * (1.0 + distortion)
-                    
-                    x = r * math.cos(angle)
-                    z = r * math.sin(angle)
-                    y = math.sin(angle * 3 + ring_phase) * 0.3
-                    
-                    glVertex3f(x, y, z)
-                glEnd()
-            
-            glPopMatrix()
-        
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glEnable(GL_DEPTH_TEST)
+            rings.append(AnimatedRing(
+                radius=radius * (1.3 + i * 0.4),
+                color=color_scheme.get_dynamic_color('glow', intensity, ring_phase, alpha),
+                segments=32,
+                phase=ring_phase,
+                distortion=0.1,
+                spin=ring_phase * 20,
+                tilt=10 + i * 15,
+                broken=True
+            ))
+        return rings
     
     def draw_energy_pulse(self, center: Tuple[float, float, float], 
                          radius: float, 
-                         pulse_phase: float = 0.0):
+                         pulse_phase: float = 0.0,
+                         now: Optional[float] = None):
         """Draw energy pulse effect emanating from center."""
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)
-        
-        cx, cy, cz = center
-        current_time = time.time() + pulse_phase
+        self.draw_animated_rings(center, self.pulse_rings(radius, pulse_phase, now))
+    
+    def pulse_rings(self, radius: float, pulse_phase: float = 0.0,
+                    now: Optional[float] = None) -> List[AnimatedRing]:
+        """Ring specs for the expanding energy pulse waves at frame time `now`."""
+        current_time = (time.perf_counter() if now is None else now) + pulse_phase
+        rings = []
         
         # Multiple pulse waves
         for i in range(2):
             wave_time = current_time * (1.5 + i * 0.5)
-            wave_radius = radius * (1.0 + (wave_time % 2.0))
             wave_alpha = max(0.0, 1.0 - (wave_time % 2.0)) * 0.2
             
             if wave_alpha > 0.01:
-                color = color_scheme.get_dynamic_color('glow', 1.0, wave_time, wave_alpha)
-                glColor4f(*color)
-                
-                glPushMatrix()
-                glTranslatef(cx, cy, cz)
-                
-                glBegin(GL_LINE_LOOP)
-                segments = 24
-                for j in range(segments):
-                    angle = 2 * math.pi * j / segments
-                    x = wave_radius * math.cos(angle)
-                    z = wave_radius * math.sin(angle)
-                    glVertex3f(x, 0, z)
-                glEnd()
-                
-                glPopMatrix()
+                rings.append(AnimatedRing(
+                    radius=radius * (1.0 + (wave_time % 2.0)),
+                    color=color_scheme.get_dynamic_color('glow', 1.0, wave_time, wave_alpha)
+                ))
+        return rings
+    
+    def draw_animated_rings(self, center: Tuple[float, float, float], 
+                           rings: List[AnimatedRing]):
+        """Draw a batch of animated rings with additive blending in one draw call.
         
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glEnable(GL_DEPTH_TEST)
+        Ring geometry (sine-table wobble, rotation, broken segments) is built on
+        the CPU into one interleaved position/color buffer, e.g. pulse and
+        distortion rings together via ``pulse_rings(...) + distortion_rings(...)``.
+        """
+        if not rings:
+            return
+        
+        chunks = []
+        for ring in rings:
+            cos_t, sin_t = _unit_circle(ring.segments)
+            verts = np.empty((ring.segments, 3), dtype=np.float32)
+            if ring.distortion:
+                # Radius wobbles with sin(4*angle + phase), height with sin(3*angle + phase)
+                # Nearest table index for each vertex angle; exact when segments divides the table
+                steps = np.rint(np.arange(ring.segments) * (_LUT_SIZE / ring.segments)).astype(np.int64) % _LUT_SIZE
+                phase_step = int(ring.phase * _LUT_SCALE)
+                r = ring.radius * (1.0 + ring.distortion * _SIN_LUT[(steps * 4 + phase_step) & _LUT_MASK])
+                verts[:, 1] = 3 * ring.distortion * _SIN_LUT[(steps * 3 + phase_step) & _LUT_MASK]
+            else:
+                r = ring.radius
+                verts[:, 1] = 0.0
+            verts[:, 0] = r * cos_t
+            verts[:, 2] = r * sin_t
+            
+            if ring.spin or ring.tilt:
+                rotation = _rotation_matrix(ring.spin, (0, 1, 0)) @ _rotation_matrix(ring.tilt, (1, 0, 1))
+                verts = verts @ rotation.T
+            
+            edges = _ring_edges(ring.segments, int(ring.phase) % 3 if ring.broken else -1)
+            chunk = np.empty((len(edges), 7), dtype=np.float32)
+            chunk[:, :3] = verts[edges]
+            chunk[:, 3:] = ring.color
+            chunks.append(chunk)
+        buf = np.concatenate(chunks)
+        
+        if buf.nbytes > self._ring_capacity:
+            if self._ring_vbo is not None:
+                glDeleteBuffers(1, [self._ring_vbo])
+            self._ring_capacity = 2 * buf.nbytes
+            self._ring_vbo = _dynamic_vbo(self._ring_capacity)
+        
+        _gl_state.set_depth_test(False)
+        _gl_state.set_blend(GL_SRC_ALPHA, GL_ONE)  # Additive blending for glow
+        
+        glPushMatrix()
+        glTranslatef(*center)
+        _bind_colored(self._ring_vbo, buf)
+        glDrawArrays(GL_LINES, 0, len(buf))
+        _unbind_colored()
+        glPopMatrix()
+        
+        _gl_state.restore()
 
 class DynamicDataDisplays:
     """Dynamic data visualization elements."""
@@ -349,51 +694,43 @@ class DynamicDataDisplays:
         glColor4f(*color)
         glLineWidth(1.0)
         
-        glBegin(GL_LINE_LOOP)
-        for i in range(48):
-            angle = 2 * math.pi * i / 48
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            glVertex2f(x, y)
-        glEnd()
+        cos_t, sin_t = _unit_circle(48)
+        circle = np.empty((48, 2), dtype=np.float32)
+        circle[:, 0] = cx + radius * cos_t
+        circle[:, 1] = cy + radius * sin_t
+        _draw_client_array(GL_LINE_LOOP, circle)
         
-        # Draw radial grid lines
+        # Spokes start at 12 o'clock: cos/sin(theta - pi/2) = (sin theta, -cos theta)
+        cos_t, sin_t = _unit_circle(segments)
+        spoke_x = sin_t
+        spoke_y = -cos_t
+        
+        # Draw radial grid lines (only the major ones)
         grid_color = color_scheme.get_color('accent', 0.2)
         glColor4f(*grid_color)
         
-        glBegin(GL_LINES)
-        for i in range(segments):
-            if i % (segments // 8) == 0:  # Only draw major grid lines
-                angle = 2 * math.pi * i / segments - math.pi / 2
-                x = cx + radius * math.cos(angle)
-                y = cy + radius * math.sin(angle)
-                glVertex2f(cx, cy)
-                glVertex2f(x, y)
-        glEnd()
+        major = slice(None, None, max(1, segments // 8))
+        grid = np.empty((len(spoke_x[major]), 2, 2), dtype=np.float32)
+        grid[:, 0] = (cx, cy)
+        grid[:, 1, 0] = cx + radius * spoke_x[major]
+        grid[:, 1, 1] = cy + radius * spoke_y[major]
+        _draw_client_array(GL_LINES, grid.reshape(-1, 2))
         
-        # Draw data bars with build-in animation
+        # Draw data bars with build-in animation: bars before the build front are
+        # full length, the bar under it grows, the rest are not drawn yet
         bar_color = color_scheme.get_dynamic_color('primary', 1.0, 0.0, 0.8)
         glColor4f(*bar_color)
         glLineWidth(3.0)
         
-        for i, value in enumerate(data):
-            if build_progress * segments > i:
-                angle = 2 * math.pi * i / segments - math.pi / 2
-                bar_length = (value / max_value) * radius * 0.9
-                
-                # Build-in effect for current bar
-                if i < build_progress * segments < i + 1:
-                    bar_progress = (build_progress * segments) - i
-                    bar_length *= bar_progress
-                
-                x1, y1 = cx, cy
-                x2 = cx + bar_length * math.cos(angle)
-                y2 = cy + bar_length * math.sin(angle)
-                
-                glBegin(GL_LINES)
-                glVertex2f(x1, y1)
-                glVertex2f(x2, y2)
-                glEnd()
+        progress = np.clip(build_progress * segments - np.arange(segments), 0.0, 1.0)
+        shown = progress > 0
+        bar_length = np.asarray(data, dtype=np.float32) / max_value * radius * 0.9 * progress
+        bars = np.empty((int(shown.sum()), 2, 2), dtype=np.float32)
+        bars[:, 0] = (cx, cy)
+        bars[:, 1, 0] = cx + bar_length[shown] * spoke_x[shown]
+        bars[:, 1, 1] = cy + bar_length[shown] * spoke_y[shown]
+        if len(bars):
+            _draw_client_array(GL_LINES, bars.reshape(-1, 2))
         
         # Restore matrices
         glPopMatrix()
@@ -454,89 +791,259 @@ class DynamicDataDisplays:
         
         glPopMatrix()
 
+class _RandomPool:
+    """Uniform [0, 1) samples generated by NumPy in bulk and handed out in slices."""
+    
+    def __init__(self, size: int = 4096):
+        self._rng = np.random.default_rng()
+        self._buf = np.empty(size, dtype=np.float64)
+        self._pos = size
+    
+    def take(self, n: int) -> np.ndarray:
+        """Return the next n samples, refilling the pool when it runs out."""
+        if self._pos + n > len(self._buf):
+            self._rng.random(out=self._buf)
+            self._pos = 0
+        samples = self._buf[self._pos:self._pos + n]
+        self._pos += n
+        return samples
+    
+    def uniform(self, low: float, high: float, shape) -> np.ndarray:
+        """Draw a fresh array of uniform samples in [low, high)."""
+        return self._rng.uniform(low, high, shape)
+
+_random_pool = _RandomPool()
+
+# Particle type ids used by the structure-of-arrays particle storage
+QUICK_FLASH, SLOW_FADE, MEDIUM, TRAILING = range(4)
+
+# Point-sprite shader: fade, size and shimmer computed per vertex from the
+# particle's birth parameters, mirroring ParticleTrails._appearance
+_PARTICLE_VERTEX_SHADER = """
+#version 120
+attribute vec3 a_base;    // base color
+attribute vec4 a_params;  // size, type id, lifespan, max life
+attribute float a_birth;  // seconds since the particle system epoch
+uniform float u_time;
+varying vec4 v_color;
+
+void main() {
+    float age = u_time - a_birth;
+    float life_ratio = (a_params.z - age) / a_params.w;
+    float alpha;
+    float scale;
+    float variation;
+    if (a_params.y < 0.5) {         // quick flash
+        alpha = min(1.0, life_ratio * 2.0) * 0.9 * (life_ratio < 0.3 ? life_ratio / 0.3 : 1.0);
+        scale = 0.8 + 0.4 * sin(life_ratio * 3.14159265);
+        variation = 1.0 + 0.2 * sin(age * 20.0);
+    } else if (a_params.y < 1.5) {  // slow fade
+        alpha = life_ratio * 0.7;
+        scale = 0.6 + 0.4 * life_ratio;
+        variation = 1.0 + 0.1 * sin(age * 2.0);
+    } else {
+        alpha = life_ratio * 0.8;
+        scale = 0.5 + 0.5 * life_ratio;
+        variation = 1.0 + 0.05 * sin(age * 8.0);
+    }
+    vec3 rgb = a_base * variation;
+    if (a_params.y < 0.5) {
+        rgb = min(rgb, vec3(1.0));
+    }
+    bool alive = life_ratio > 0.0;
+    v_color = vec4(rgb, alive ? alpha : 0.0);
+    gl_PointSize = alive ? a_params.x * scale : 0.0;
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex;
+}
+"""
+
+_PARTICLE_FRAGMENT_SHADER = """
+#version 120
+varying vec4 v_color;
+
+void main() {
+    // Round, smooth-edged sprites
+    float r = length(gl_PointCoord - vec2(0.5));
+    if (v_color.a <= 0.01 || r > 0.5) {
+        discard;
+    }
+    gl_FragColor = vec4(v_color.rgb, v_color.a * smoothstep(0.5, 0.4, r));
+}
+"""
+
+# Per-slot shader attributes: base rgb, size, type id, lifespan, max life, birth
+_ATTRIB_STRIDE = 8 * 4
+
+# Spawn templates, one row per particle type id; random samples in [0, 1)
+# interpolate each lo/hi pair
+_SPAWN_DTYPE = np.dtype([
+    ('vel_lo', np.float32), ('vel_hi', np.float32),
+    ('life_lo', np.float32), ('life_hi', np.float32), ('max_life', np.float32),
+    ('size_lo', np.float32), ('size_hi', np.float32),
+    ('color_lo', np.float32, 3), ('color_hi', np.float32, 3),
+    ('mag', np.float32),
+])
+_SPAWN_TYPES = {
+    # Tiny, quick flashes - bright and fast, bright white-gold
+    QUICK_FLASH: (1.2, 2.0, 0.3, 0.8, 0.8, 1.0, 2.5, (1.0, 0.95, 0.4), (1.0, 0.95, 0.4), 0.6),
+    # Larger, slower particles - warm and persistent, warm gold
+    SLOW_FADE: (0.3, 0.7, 2.0, 3.5, 3.5, 2.5, 4.5, (0.9, 0.7, 0.3), (0.9, 0.7, 0.3), 1.4),
+    # Medium particles (balanced) with a randomized warm color
+    MEDIUM: (1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 3.5, (0.7, 0.6, 0.2), (1.0, 0.9, 0.6), 1.0),
+    # Particles that leave trails, slight purple tint
+    TRAILING: (1.0, 1.0, 1.5, 2.5, 2.5, 1.8, 3.2, (0.8, 0.6, 0.9), (0.8, 0.6, 0.9), 1.0),
+}
+_SPAWN_TEMPLATES = np.array([_SPAWN_TYPES[t] for t in range(len(_SPAWN_TYPES))], dtype=_SPAWN_DTYPE)
+
+def _integrate_particles(pos, vel, mag, type_id, slots, dt):
+    """Advance the given particle slots one step through the magnetic field."""
+    for k in range(slots.shape[0]):
+        i = slots[k]
+        px = pos[i, 0] + vel[i, 0] * dt
+        py = pos[i, 1] + vel[i, 1] * dt
+        pz = pos[i, 2] + vel[i, 2] * dt
+        pos[i, 0] = px
+        pos[i, 1] = py
+        pos[i, 2] = pz
+        
+        vx = vel[i, 0]
+        vy = vel[i, 1]
+        vz = vel[i, 2]
+        distance = math.sqrt(px * px + py * py + pz * pz)
+        if distance > 0.0:
+            radial = 0.3 * mag[i] / (1.0 + distance * 0.5)
+            tangential = 0.8 * mag[i]
+            if type_id[i] == QUICK_FLASH:
+                tangential *= 1.5
+            vx += (py * tangential - px * radial) * dt
+            vy += (-px * tangential - py * radial) * dt
+            vz += (pz * tangential * 0.3 - pz * radial) * dt
+        
+        if type_id[i] == QUICK_FLASH:
+            vx += np.random.uniform(-0.02, 0.02)
+            vy += np.random.uniform(-0.02, 0.02)
+            vz += np.random.uniform(-0.02, 0.02)
+            drag = 0.96
+        elif type_id[i] == SLOW_FADE:
+            drag = 0.98 * 0.98
+        else:
+            drag = 0.96
+        
+        vel[i, 0] = vx * drag
+        vel[i, 1] = vy * drag
+        vel[i, 2] = vz * drag
+
+if HAS_NUMBA:
+    _integrate_particles = njit(fastmath=True, cache=True, boundscheck=False)(_integrate_particles)
+
 class ParticleTrails:
     """Enhanced particle trail effects with magnetic field simulation and varied types."""
     
     def __init__(self):
         self.max_particles = 200
-        self.particles = []
-        self.last_update = time.time()
+        self.trail_length = 8
+        
+        # Structure-of-arrays particle state, one slot per particle
+        n = self.max_particles
+        self.pos = np.zeros((n, 3), dtype=np.float32)
+        self.vel = np.zeros((n, 3), dtype=np.float32)
+        self.life = np.zeros(n, dtype=np.float32)
+        self.max_life = np.ones(n, dtype=np.float32)
+        self.lifespan = np.zeros(n, dtype=np.float32)
+        self.size = np.zeros(n, dtype=np.float32)
+        self.color_base = np.zeros((n, 3), dtype=np.float32)
+        self.mag = np.zeros(n, dtype=np.float32)
+        self.birth_time = np.zeros(n, dtype=np.float64)
+        self.type_id = np.zeros(n, dtype=np.int8)
+        self.alive = np.zeros(n, dtype=bool)
+        
+        # Trail history as per-slot circular buffers: the next write goes to
+        # trail_head, and the newest trail_count entries are valid
+        self.trails = np.zeros((n, self.trail_length, 3), dtype=np.float32)
+        self.trail_head = np.zeros(n, dtype=np.int8)
+        self.trail_count = np.zeros(n, dtype=np.int8)
+        self.last_update = time.perf_counter()
+        
+        # Dynamic vertex buffers, created on first draw once a GL context exists
+        self._point_vbo = None
+        self._trail_vbo = None
+        
+        # Point-sprite shader state; None until first draw, False if unsupported.
+        # Times sent to the GPU are relative to the epoch to keep float32 precision.
+        self._program = None
+        self._uniform_time = -1
+        self._attrib_locs: Dict[str, int] = {}
+        self._position_vbo = None
+        self._attrib_vbo = None
+        self._attribs_dirty = True
+        self._epoch = time.perf_counter()
+    
+    def _release(self, slots: np.ndarray):
+        """Mark slots as dead."""
+        self.alive[slots] = False
+        self.trail_count[slots] = 0
     
     def add_spark_particle(self, position: Tuple[float, float, float], 
                           velocity: Tuple[float, float, float],
-                          intensity: float = 1.0):
+                          intensity: float = 1.0,
+                          now: Optional[float] = None):
         """Add enhanced spark particles with different characteristics."""
-        if len(self.particles) >= self.max_particles:
-            self.particles.pop(0)  # Remove oldest particle
-        
-        import random
-        
-        # Create different particle types for variety
-        particle_type = random.choice(['quick_flash', 'slow_fade', 'medium', 'trailing'])
-        
-        if particle_type == 'quick_flash':
-            # Tiny, quick flashes - bright and fast
-            particle = {
-                'position': list(position),
-                'velocity': [v * random.uniform(1.2, 2.0) for v in velocity],
-                'life': random.uniform(0.3, 0.8),
-                'max_life': 0.8,
-                'size': random.uniform(1.0, 2.5),
-                'color_base': [1.0, 0.95, 0.4],  # Bright white-gold
-                'type': 'quick_flash',
-                'magnetic_influence': 0.6,
-                'birth_time': time.time(),
-                'trail_length': 0
-            }
-        elif particle_type == 'slow_fade':
-            # Larger, slower particles - warm and persistent
-            particle = {
-                'position': list(position),
-                'velocity': [v * random.uniform(0.3, 0.7) for v in velocity],
-                'life': random.uniform(2.0, 3.5),
-                'max_life': 3.5,
-                'size': random.uniform(2.5, 4.5),
-                'color_base': [0.9, 0.7, 0.3],  # Warm gold
-                'type': 'slow_fade',
-                'magnetic_influence': 1.4,
-                'birth_time': time.time(),
-                'trail_length': 0
-            }
-        elif particle_type == 'trailing':
-            # Particles that leave trails
-            particle = {
-                'position': list(position),
-                'velocity': list(velocity),
-                'life': random.uniform(1.5, 2.5),
-                'max_life': 2.5,
-                'size': random.uniform(1.8, 3.2),
-                'color_base': [0.8, 0.6, 0.9],  # Slight purple tint
-                'type': 'trailing',
-                'magnetic_influence': 1.0,
-                'birth_time': time.time(),
-                'trail_positions': [list(position)],  # Store trail positions
-                'trail_length': 8
-            }
-        else:
-            # Medium particles (balanced)
-            particle = {
-                'position': list(position),
-                'velocity': list(velocity),
-                'life': random.uniform(1.0, 2.0),
-                'max_life': 2.0,
-                'size': random.uniform(2.0, 3.5),
-                'color_base': [
-                    random.uniform(0.7, 1.0),
-                    random.uniform(0.6, 0.9),
-                    random.uniform(0.2, 0.6)
-                ],
-                'type': 'medium',
-                'magnetic_influence': 1.0,
-                'birth_time': time.time(),
-                'trail_length': 0
-            }
+        self.add_spark_particles_bulk([position], [velocity], intensity, now)
+    
+    def add_spark_particles_bulk(self, positions, velocities,
+                                 intensity: float = 1.0,
+                                 now: Optional[float] = None):
+        """Spawn one spark per (position, velocity) row with randomly chosen types.
         
-        self.particles.append(particle)
+        Args:
+            positions: (n, 3) array-like of spawn positions
+            velocities: (n, 3) array-like of initial velocities
+            intensity: Spawn intensity (reserved, kept for API compatibility)
+            now: Frame time from time.perf_counter()
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 3)
+        # The pool holds max_particles sparks, so only the newest that many can be placed
+        positions = positions[-self.max_particles:]
+        velocities = velocities[-self.max_particles:]
+        n = len(positions)
+        if n == 0:
+            return
+        
+        # Dead slots are filled first; only a full pool evicts its oldest particles
+        slots = np.flatnonzero(~self.alive)[:n]
+        if len(slots) < n:
+            age_key = np.where(self.alive, self.birth_time, np.inf)
+            oldest = np.argpartition(age_key, n - len(slots) - 1)[:n - len(slots)]
+            slots = np.concatenate((slots, oldest))
+        
+        # Pooled samples per spark: type, three velocity scales, life, size, color
+        u = _random_pool.take(9 * n).reshape(n, 9)
+        
+        # Pick a type per spark and gather its template row
+        types = (u[:, 0] * len(_SPAWN_TYPES)).astype(np.int8)
+        t = _SPAWN_TEMPLATES[types]
+        
+        self.pos[slots] = positions
+        vel_lo = t['vel_lo'][:, None]
+        vel_hi = t['vel_hi'][:, None]
+        self.vel[slots] = velocities * (vel_lo + (vel_hi - vel_lo) * u[:, 1:4])
+        self.life[slots] = t['life_lo'] + (t['life_hi'] - t['life_lo']) * u[:, 4]
+        self.max_life[slots] = t['max_life']
+        self.size[slots] = t['size_lo'] + (t['size_hi'] - t['size_lo']) * u[:, 5]
+        self.color_base[slots] = t['color_lo'] + (t['color_hi'] - t['color_lo']) * u[:, 6:9]
+        self.mag[slots] = t['mag']
+        self.type_id[slots] = types
+        self.lifespan[slots] = self.life[slots]
+        self.birth_time[slots] = time.perf_counter() if now is None else now
+        self._attribs_dirty = True
+        
+        # Trailing particles start their history at the spawn point
+        trailing = types == TRAILING
+        self.trails[slots[trailing], 0] = positions[trailing]
+        self.trail_head[slots] = 1
+        self.trail_count[slots] = trailing
+        self.alive[slots] = True
     
     def add_particle(self, position: Tuple[float, float, float], 
                     velocity: Tuple[float, float, float],
@@ -545,150 +1052,253 @@ class ParticleTrails:
         """Legacy method - redirect to enhanced spark particle system."""
         self.add_spark_particle(position, velocity, intensity=1.0)
     
-    def update_particles(self):
-        """Update particle positions with magnetic field simulation and curved paths."""
-        current_time = time.time()
+    def update_particles(self, now: Optional[float] = None):
+        """Update particle positions with magnetic field simulation and curved paths.
+        
+        Args:
+            now: Frame time from time.perf_counter(), sampled once by the caller
+        """
+        current_time = time.perf_counter() if now is None else now
         dt = current_time - self.last_update
         self.last_update = current_time
         
-        # Update existing particles
-        alive_particles = []
-        for particle in self.particles:
-            particle['life'] -= dt
-            if particle['life'] > 0:
-                # Store old position for trailing particles
-                if particle['type'] == 'trailing':
-                    particle['trail_positions'].append(list(particle['position']))
-                    if len(particle['trail_positions']) > particle['trail_length']:
-                        particle['trail_positions'].pop(0)
-                
-                # Update position
-                for i in range(3):
-                    particle['position'][i] += particle['velocity'][i] * dt
-                
-                # Magnetic field simulation - creates curved paths
-                magnetic_strength = particle['magnetic_influence']
-                sphere_attraction = 0.3 * magnetic_strength
-                
-                # Calculate distance from center for magnetic field effect
-                distance = math.sqrt(sum(p**2 for p in particle['position']))
-                if distance > 0:
-                    # Radial force (toward center)
-                    radial_force = sphere_attraction / (1.0 + distance * 0.5)
-                    for i in range(3):
-                        particle['velocity'][i] -= particle['position'][i] * radial_force * dt
-                    
-                    # Tangential force (creates curved motion)
-                    tangential_strength = 0.8 * magnetic_strength
-                    if particle['type'] == 'quick_flash':
-                        tangential_strength *= 1.5  # More erratic for quick flashes
-                    
-                    # Cross product for tangential force (simulates magnetic field)
-                    tangential = [
-                        particle['position'][1] * tangential_strength * dt,
-                        -particle['position'][0] * tangential_strength * dt,
-                        particle['position'][2] * tangential_strength * 0.3 * dt
-                    ]
-                    
-                    for i in range(3):
-                        particle['velocity'][i] += tangential[i]
-                
-                # Type-specific behaviors
-                if particle['type'] == 'quick_flash':
-                    # Add some random jitter for erratic movement
-                    import random
-                    jitter = 0.02
-                    for i in range(3):
-                        particle['velocity'][i] += random.uniform(-jitter, jitter)
-                elif particle['type'] == 'slow_fade':
-                    # Slower, more graceful movement
-                    drag = 0.98
-                    for i in range(3):
-                        particle['velocity'][i] *= drag
-                
-                # General air resistance
-                drag = 0.96 if particle['type'] != 'slow_fade' else 0.98
-                for i in range(3):
-                    particle['velocity'][i] *= drag
-                
-                alive_particles.append(particle)
-        
-        self.particles = alive_particles
-    
-    def draw_particles(self):
-        """Draw all active particles with enhanced visuals and trails."""
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)  # Additive blending for glow
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        
+        # Age particles and retire the expired ones
+        self.life[idx] -= dt
+        expired = self.life[idx] <= 0
+        if expired.any():
+            self._release(idx[expired])
+            idx = idx[~expired]
+            if len(idx) == 0:
+                return
+        
+        types = self.type_id[idx]
+        
+        # Store old position for trailing particles
+        trailing = idx[types == TRAILING]
+        if len(trailing):
+            head = self.trail_head[trailing]
+            self.trails[trailing, head] = self.pos[trailing]
+            self.trail_head[trailing] = (head + 1) % self.trail_length
+            self.trail_count[trailing] = np.minimum(self.trail_count[trailing] + 1, self.trail_length)
+        
+        if HAS_NUMBA:
+            _integrate_particles(self.pos, self.vel, self.mag, self.type_id, idx, dt)
+            return
+        
+        pos = self.pos[idx]
+        vel = self.vel[idx]
+        mag = self.mag[idx]
+        quick = types == QUICK_FLASH
+        
+        # Update position
+        pos += vel * dt
+        
+        # Magnetic field simulation - radial pull toward the center plus a
+        # tangential (cross product) push that curves the paths
+        distance = np.sqrt((pos * pos).sum(axis=1))
+        radial_force = 0.3 * mag / (1.0 + distance * 0.5)
+        tangential_strength = 0.8 * mag * np.where(quick, 1.5, 1.0)
+        
+        force = np.empty_like(pos)
+        force[:, 0] = pos[:, 1] * tangential_strength
+        force[:, 1] = -pos[:, 0] * tangential_strength
+        force[:, 2] = pos[:, 2] * tangential_strength * 0.3
+        force -= pos * radial_force[:, None]
+        force[distance <= 0] = 0.0
+        vel += force * dt
+        
+        # Random jitter for erratic quick flashes
+        n_quick = int(quick.sum())
+        if n_quick:
+            vel[quick] += _random_pool.uniform(-0.02, 0.02, (n_quick, 3))
+        
+        # Slow fades get an extra graceful drag on top of the general air resistance
+        vel *= np.where(types == SLOW_FADE, 0.98 * 0.98, 0.96)[:, None]
+        
+        self.pos[idx] = pos
+        self.vel[idx] = vel
+    
+    def draw_particles(self, now: Optional[float] = None):
+        """Draw all active particles with enhanced visuals and trails.
+        
+        Args:
+            now: Frame time from time.perf_counter(), sampled once by the caller
+        """
+        if now is None:
+            now = time.perf_counter()
+        idx = np.flatnonzero(self.alive)
+        
+        _gl_state.set_depth_test(False)
+        _gl_state.set_blend(GL_SRC_ALPHA, GL_ONE)  # Additive blending for glow
         glEnable(GL_POINT_SMOOTH)
         
-        for particle in self.particles:
-            life_ratio = particle['life'] / particle['max_life']
-            
-            # Type-specific alpha calculations
-            if particle['type'] == 'quick_flash':
-                # Sharp peak then fast fade
-                alpha = min(1.0, life_ratio * 2.0) * 0.9
-                if life_ratio < 0.3:
-                    alpha *= (life_ratio / 0.3)
-            elif particle['type'] == 'slow_fade':
-                # Gentle, sustained glow
-                alpha = life_ratio * 0.7
+        if len(idx):
+            self._ensure_buffers()
+            if self._ensure_program():
+                # The shader handles every point; only trails need CPU-side fades
+                trailing = idx[self.type_id[idx] == TRAILING]
+                if len(trailing):
+                    alpha, _, colors = self._appearance(trailing, now)
+                    visible = alpha > 0.01
+                    self._draw_trails(trailing[visible], colors[visible], alpha[visible])
+                self._draw_point_sprites(now)
             else:
-                # Standard fade
-                alpha = life_ratio * 0.8
-            
-            if alpha > 0.01:
-                # Calculate size based on particle type and life
-                if particle['type'] == 'quick_flash':
-                    size = particle['size'] * (0.8 + 0.4 * math.sin(life_ratio * math.pi))
-                elif particle['type'] == 'slow_fade':
-                    size = particle['size'] * (0.6 + 0.4 * life_ratio)
-                else:
-                    size = particle['size'] * (0.5 + 0.5 * life_ratio)
-                
-                # Color calculation with dynamic effects
-                base_color = particle['color_base']
-                age = time.time() - particle['birth_time']
-                
-                # Add some color variation based on age and type
-                color = []
-                for i, base in enumerate(base_color):
-                    if particle['type'] == 'quick_flash':
-                        # Bright, flickering
-                        flicker = 1.0 + 0.2 * math.sin(age * 20)
-                        color.append(min(1.0, base * flicker))
-                    elif particle['type'] == 'slow_fade':
-                        # Warm, stable
-                        warmth = 1.0 + 0.1 * math.sin(age * 2)
-                        color.append(base * warmth)
-                    else:
-                        # Standard with slight shimmer
-                        shimmer = 1.0 + 0.05 * math.sin(age * 8)
-                        color.append(base * shimmer)
-                
-                color.append(alpha)  # Add alpha
-                glColor4f(*color)
-                
-                # Draw trailing particles
-                if particle['type'] == 'trailing' and 'trail_positions' in particle:
-                    glLineWidth(2.0)
-                    glBegin(GL_LINE_STRIP)
-                    for j, trail_pos in enumerate(particle['trail_positions']):
-                        trail_alpha = alpha * (j / len(particle['trail_positions'])) * 0.5
-                        trail_color = color[:3] + [trail_alpha]
-                        glColor4f(*trail_color)
-                        glVertex3f(*trail_pos)
-                    glEnd()
-                
-                # Draw main particle
-                glPointSize(size)
-                glBegin(GL_POINTS)
-                glVertex3f(*particle['position'])
-                glEnd()
+                alpha, size, colors = self._appearance(idx, now)
+                visible = alpha > 0.01
+                slots = idx[visible]
+                trailing = self.type_id[slots] == TRAILING
+                self._draw_trails(slots[trailing], colors[visible][trailing], alpha[visible][trailing])
+                self._draw_point_buckets(slots, colors[visible], alpha[visible], size[visible])
         
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glEnable(GL_DEPTH_TEST)
+        _gl_state.restore()
+    
+    def _appearance(self, slots: np.ndarray, now: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return per-particle (alpha, point size, rgb) for the given slots."""
+        types = self.type_id[slots]
+        quick = types == QUICK_FLASH
+        slow = types == SLOW_FADE
+        life_ratio = self.life[slots] / self.max_life[slots]
+        base_size = self.size[slots]
+        
+        # Type-specific alpha: quick flashes peak sharply then fade fast,
+        # slow fades keep a gentle sustained glow
+        alpha = life_ratio * 0.8
+        alpha[slow] = life_ratio[slow] * 0.7
+        quick_ratio = life_ratio[quick]
+        alpha[quick] = (np.minimum(1.0, quick_ratio * 2.0) * 0.9 *
+                        np.where(quick_ratio < 0.3, quick_ratio / 0.3, 1.0))
+        
+        # Size based on particle type and life
+        size = base_size * (0.5 + 0.5 * life_ratio)
+        size[slow] = base_size[slow] * (0.6 + 0.4 * life_ratio[slow])
+        size[quick] = base_size[quick] * (0.8 + 0.4 * np.sin(quick_ratio * math.pi))
+        
+        # Color variation based on age: flicker, warmth or a slight shimmer
+        age = now - self.birth_time[slots]
+        variation = 1.0 + 0.05 * np.sin(age * 8)
+        variation[quick] = 1.0 + 0.2 * np.sin(age[quick] * 20)
+        variation[slow] = 1.0 + 0.1 * np.sin(age[slow] * 2)
+        colors = self.color_base[slots] * variation[:, None]
+        colors[quick] = np.minimum(1.0, colors[quick])
+        return alpha, size, colors
+    
+    def _ensure_buffers(self):
+        """Allocate the dynamic buffers once a GL context is current."""
+        if self._point_vbo is None:
+            self._point_vbo = _dynamic_vbo(self.max_particles * _COLORED_STRIDE)
+            self._trail_vbo = _dynamic_vbo(
+                self.max_particles * 2 * (self.trail_length - 1) * _COLORED_STRIDE)
+    
+    def _ensure_program(self) -> bool:
+        """Compile the point-sprite shader on first use; False means fixed-function."""
+        if self._program is None:
+            try:
+                self._program = shaders.compileProgram(
+                    shaders.compileShader(_PARTICLE_VERTEX_SHADER, GL_VERTEX_SHADER),
+                    shaders.compileShader(_PARTICLE_FRAGMENT_SHADER, GL_FRAGMENT_SHADER)
+                )
+            except (RuntimeError, OpenGLError) as e:
+                logger.warning(f"Particle shader unavailable, using fixed-function points: {e}")
+                self._program = False
+                return False
+            self._uniform_time = glGetUniformLocation(self._program, 'u_time')
+            self._attrib_locs = {
+                name: glGetAttribLocation(self._program, name)
+                for name in ('a_base', 'a_params', 'a_birth')
+            }
+            self._position_vbo = _dynamic_vbo(self.pos.nbytes)
+            self._attrib_vbo = _dynamic_vbo(self.max_particles * _ATTRIB_STRIDE)
+        return bool(self._program)
+    
+    def _draw_point_sprites(self, now: float):
+        """Draw every slot in one call; the shader fades and sizes each point."""
+        if self._attribs_dirty:
+            attribs = np.empty((self.max_particles, 8), dtype=np.float32)
+            attribs[:, :3] = self.color_base
+            attribs[:, 3] = self.size
+            attribs[:, 4] = self.type_id
+            attribs[:, 5] = self.lifespan
+            attribs[:, 6] = self.max_life
+            attribs[:, 7] = self.birth_time - self._epoch
+            glBindBuffer(GL_ARRAY_BUFFER, self._attrib_vbo)
+            glBufferSubData(GL_ARRAY_BUFFER, 0, attribs.nbytes, attribs)
+            self._attribs_dirty = False
+        
+        glEnable(GL_PROGRAM_POINT_SIZE)
+        glEnable(GL_POINT_SPRITE)
+        glUseProgram(self._program)
+        glUniform1f(self._uniform_time, now - self._epoch)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._position_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.pos.nbytes, self.pos)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._attrib_vbo)
+        layout = (('a_base', 3, 0), ('a_params', 4, 12), ('a_birth', 1, 28))
+        for name, size, offset in layout:
+            loc = self._attrib_locs[name]
+            glEnableVertexAttribArray(loc)
+            glVertexAttribPointer(loc, size, GL_FLOAT, GL_FALSE, _ATTRIB_STRIDE, ctypes.c_void_p(offset))
+        
+        glDrawArrays(GL_POINTS, 0, self.max_particles)
+        
+        for name, _, _ in layout:
+            glDisableVertexAttribArray(self._attrib_locs[name])
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+        glDisable(GL_POINT_SPRITE)
+    
+    def _draw_trails(self, slots: np.ndarray, colors: np.ndarray, alpha: np.ndarray):
+        """Draw trails as one batch of segments fading toward the oldest position."""
+        keep = self.trail_count[slots] >= 2
+        slots, colors, alpha = slots[keep], colors[keep], alpha[keep]
+        if not len(slots):
+            return
+        
+        # Unroll each circular buffer oldest-first; entries j >= count are unused
+        length = self.trail_length
+        count = self.trail_count[slots].astype(np.int32)[:, None]
+        j = np.arange(length)
+        order = (self.trail_head[slots].astype(np.int32)[:, None] - count + j) % length
+        
+        points = np.empty((len(slots), length, 7), dtype=np.float32)
+        points[:, :, :3] = self.trails[slots[:, None], order]
+        points[:, :, 3:6] = colors[:, None, :]
+        points[:, :, 6] = alpha[:, None] * j / count * 0.5
+        
+        # Segment j joins points j and j+1; pair them up as GL_LINES vertices
+        segments = np.stack([points[:, :-1], points[:, 1:]], axis=2)
+        buf = segments[j[:-1] + 1 < count].reshape(-1, 7)
+        
+        glLineWidth(2.0)
+        _bind_colored(self._trail_vbo, buf)
+        glDrawArrays(GL_LINES, 0, len(buf))
+        _unbind_colored()
+    
+    def _draw_point_buckets(self, slots: np.ndarray, colors: np.ndarray,
+                            alpha: np.ndarray, size: np.ndarray):
+        """Fixed-function fallback: points sorted into half-pixel size buckets."""
+        if not len(slots):
+            return
+        buckets = np.rint(size * 2).astype(np.int32)
+        order = np.argsort(buckets, kind='stable')
+        buf = np.empty((len(slots), 7), dtype=np.float32)
+        buf[:, :3] = self.pos[slots[order]]
+        buf[:, 3:6] = colors[order]
+        buf[:, 6] = alpha[order]
+        keys, starts, counts = np.unique(buckets[order], return_index=True, return_counts=True)
+        
+        _bind_colored(self._point_vbo, buf)
+        for key, start, count in zip(keys.tolist(), starts.tolist(), counts.tolist()):
+            glPointSize(max(key, 1) * 0.5)
+            glDrawArrays(GL_POINTS, start, count)
+        _unbind_colored()
 
 # Global instances
 geometric_patterns = GeometricPatterns()
@@ -1,26 +1,37 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
-from pydantic import Field
 
-# Load environment variables from .env file
-load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
+_ENV_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
+_loaded = False
 
-class Settings(BaseSettings):
+def load_env():
+	"""Load environment variables from the .env file once per process."""
+	global _loaded
+	if not _loaded:
+		load_dotenv(_ENV_FILE)
+		_loaded = True
+
+def _env_bool(name: str, default: bool = False) -> bool:
+	value = os.environ.get(name)
+	if value is None:
+		return default
+	return value.strip().lower() in ('1', 'true', 't', 'yes', 'y', 'on')
+
+load_env()
+
+@dataclass(frozen=True, slots=True)
+class Settings:
 	# Application settings
-	APP_NAME: str = Field(default="Saba App", description="Application name")
-	DEBUG: bool = Field(default=False, description="Enable debug mode")
-	ENV: str = Field(default="development", description="Environment (development, staging, production)")
+	APP_NAME: str = os.environ.get('APP_NAME', "Saba App")  # Application name
+	DEBUG: bool = _env_bool('DEBUG')  # Enable debug mode
+	ENV: str = os.environ.get('ENV', "development")  # Environment (development, staging, production)
 
 	# API Keys
-	WEATHER_API_KEY: str = Field(default_factory=lambda: os.getenv('WEATHER_API_KEY', ''), description="Weather API Key")
-	OMDB_API_KEY: str = Field(default_factory=lambda: os.getenv('OMDB_API_KEY', ''), description="OMDB API Key")
-	IPINFO_KEY: str = Field(default_factory=lambda: os.getenv('IPINFO_KEY', ''), description="IPInfo API Key")
-	MAL_API_CLIENT_ID: str = Field(default_factory=lambda: os.getenv('MAL_API_CLIENT_ID', ''), description="MyAnimeList API Client ID")
-
-	class Config:
-		env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
-		env_file_encoding = 'utf-8'
+	WEATHER_API_KEY: str = os.environ.get('WEATHER_API_KEY', '')
+	OMDB_API_KEY: str = os.environ.get('OMDB_API_KEY', '')
+	IPINFO_KEY: str = os.environ.get('IPINFO_KEY', '')
+	MAL_API_CLIENT_ID: str = os.environ.get('MAL_API_CLIENT_ID', '')  # MyAnimeList API Client ID
 
 # Instantiate settings
 settings = Settings()
@@ -2,17 +2,21 @@
 Universal logger configuration for the Saba application.
 Provides centralized logging with different levels and formatters.
 """
+import atexit
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import Optional
+import threading
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Callable, List, Optional
 
 class SabaLogger:
     """Universal logger for the Saba application."""
     
     _instance = None
-    _loggers = {}
+    _listener: Optional[QueueListener] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -22,10 +26,6 @@ class SabaLogger:
     
     def _setup_root_logger(self):
         """Setup the root logger configuration."""
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
         # Configure root logger
         root_logger = logging.getLogger('saba')
         root_logger.setLevel(logging.DEBUG)
@@ -33,7 +33,28 @@ class SabaLogger:
         # Clear any existing handlers
         root_logger.handlers.clear()
         
-        # Console handler with colored output
+        # Console output stays inline; file writes are handed to a background
+        # listener thread so logging callers never block on disk I/O. The log
+        # files themselves are only opened once the first record arrives.
+        file_handlers = _LazyFileHandler(self._ensure_file_handlers)
+        log_queue = queue.Queue(-1)
+        self._listener = QueueListener(log_queue, file_handlers, respect_handler_level=True)
+        self._listener.start()
+        
+        # atexit runs in reverse order: the listener drains the queue before
+        # the file buffers are flushed and closed
+        atexit.register(file_handlers.close)
+        atexit.register(self._listener.stop)
+        
+        # Add handlers to root logger
+        root_logger.addHandler(self._setup_console())
+        root_logger.addHandler(QueueHandler(log_queue))
+        
+        # Prevent propagation to avoid duplicate logs
+        root_logger.propagate = False
+    
+    def _setup_console(self) -> logging.Handler:
+        """Create the console handler with colored output."""
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_formatter = ColoredFormatter(
@@ -41,12 +62,16 @@ class SabaLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
+        return console_handler
+    
+    def _ensure_file_handlers(self) -> List[logging.Handler]:
+        """Create the logs directory and the buffered file handlers."""
+        # Create logs directory if it doesn't exist
+        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+        os.makedirs(log_dir, exist_ok=True)
         
         # File handler for all logs
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, f'saba_{datetime.now().strftime("%Y%m%d")}.log'),
-            encoding='utf-8'
-        )
+        file_handler = _BufferedRotatingFileHandler(os.path.join(log_dir, 'saba.log'))
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
@@ -55,37 +80,69 @@ class SabaLogger:
         file_handler.setFormatter(file_formatter)
         
         # Error file handler for errors only
-        error_handler = logging.FileHandler(
-            os.path.join(log_dir, f'saba_errors_{datetime.now().strftime("%Y%m%d")}.log'),
-            encoding='utf-8'
-        )
+        error_handler = _BufferedRotatingFileHandler(os.path.join(log_dir, 'saba_errors.log'))
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
         
-        # Add handlers to root logger
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(error_handler)
-        
-        # Prevent propagation to avoid duplicate logs
-        root_logger.propagate = False
+        # Each file is buffered and written in batches, flushed at once on ERROR records
+        buffered_handlers = []
+        for handler in (file_handler, error_handler):
+            buffered = MemoryHandler(512, flushLevel=logging.ERROR, target=handler, flushOnClose=True)
+            buffered.setLevel(handler.level)
+            buffered_handlers.append(buffered)
+        return buffered_handlers
+
+
+class _BufferedRotatingFileHandler(TimedRotatingFileHandler):
+    """Log file rotated at midnight and written through a 64 KB buffer."""
     
-    def get_logger(self, name: str) -> logging.Logger:
-        """
-        Get or create a logger with the specified name.
-        
-        Args:
-            name: Logger name (usually __name__ of the module)
-            
-        Returns:
-            Configured logger instance
-        """
-        if name not in self._loggers:
-            # Create child logger
-            logger = logging.getLogger(f'saba.{name}')
-            self._loggers[name] = logger
-        
-        return self._loggers[name]
+    BUFFER_SIZE = 65536
+    _defer_flush = False
+    
+    def __init__(self, filename: str):
+        super().__init__(filename, when='midnight', backupCount=14, encoding='utf-8')
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record; let routine records
+        # collect in the buffer and push errors (and all before them) to disk
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
+
+
+class _LazyFileHandler(logging.Handler):
+    """Forwards records to the file handlers, creating them on the first record."""
+    
+    def __init__(self, factory: Callable[[], List[logging.Handler]]):
+        super().__init__(logging.DEBUG)
+        self._factory = factory
+        self._handlers: Optional[List[logging.Handler]] = None
+        self._init_lock = threading.Lock()
+    
+    def emit(self, record):
+        if self._handlers is None:
+            with self._init_lock:
+                if self._handlers is None:
+                    self._handlers = self._factory()
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def close(self):
+        with self._init_lock:
+            for handler in self._handlers or ():
+                handler.close()
+        super().close()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -101,19 +158,24 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names are built once; piped output is left uncolored
+        if sys.stdout.isatty():
+            self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+        else:
+            self._colored = {}
+    
     def format(self, record):
         """Format the log record with colors."""
-        # Save original levelname
-        original_levelname = record.levelname
+        colored = self._colored.get(record.levelname)
+        if colored is None:
+            return super().format(record)
         
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        
-        # Format the message
+        # Swap in the colored levelname and restore it after formatting
+        original_levelname = record.levelname
+        record.levelname = colored
         formatted = super().format(record)
-        
-        # Restore original levelname
         record.levelname = original_levelname
         
         return formatted
@@ -122,26 +184,23 @@ class ColoredFormatter(logging.Formatter):
 # Global logger instance
 _saba_logger = SabaLogger()
 
-def get_logger(name: Optional[str] = None) -> logging.Logger:
+@lru_cache(maxsize=None)
+def _cached_logger(name: str) -> logging.Logger:
+    """Return the child logger for a module name, created once per name."""
+    return logging.getLogger(f'saba.{name}')
+
+
+def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the specified module.
     
     Args:
         name: Logger name (usually __name__ of the module)
-              If None, uses the calling module's name
         
     Returns:
         Configured logger instance
     """
-    if name is None:
-        # Get the caller's module name
-        frame = sys._getframe(1)
-        name = frame.f_globals.get('__name__', 'unknown')
-        # Remove 'saba.' prefix if present
-        if name.startswith('saba.'):
-            name = name[5:]
-    
-    return _saba_logger.get_logger(name)
+    return _cached_logger(name)
 
 
 def set_log_level(level: str):
@@ -1,5 +1,4 @@
 # Entry point for the application
-from UI.saba_ui_manager import SabaUIManager
 from config.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,6 +10,9 @@ def main():
     """
     logger.info("Starting Saba application...")
     
+    # Imported here so importing this module doesn't load the UI, speech and LLM stacks
+    from UI.saba_ui_manager import SabaUIManager
+    
     # Create and initialize the UI manager
     ui_manager = SabaUIManager()
     ui_manager.initialize()
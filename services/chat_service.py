@@ -2,15 +2,39 @@
 Chat Service for handling conversation logic and command processing.
 This service manages the conversation flow, processes user input, and generates responses.
 """
+import os
+import re
 import sys
+import time
 import asyncio
+from datetime import datetime
+from functools import lru_cache
 from services.speech_service import AsyncSpeechService
 from services.llm_service import AsyncLLMService, LLMConfig
 from tools.agents import AsyncAgentExecutor
+from tools.text_cleanup import reasoning_line_re
 from config.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Command keywords matched as whole words in a single pass, mapped to the
+# command they trigger. When several match, the first in _COMMAND_PRIORITY wins.
+_COMMAND_RE = re.compile(r"\b(hello|hi|time|goodbye|bye)\b", re.IGNORECASE)
+_COMMANDS = {"hello": "greeting", "hi": "greeting", "time": "time", "goodbye": "goodbye", "bye": "goodbye"}
+_COMMAND_PRIORITY = ("greeting", "time", "goodbye")
+
+# Spoken replies also drop Next Step lines asking the user to provide something
+_REASONING_RE = reasoning_line_re("Please|Suggest|(?i:provide)")
+
+@lru_cache(maxsize=2)
+def _format_time(minute: int) -> str:
+    """Format the wall-clock time once per minute."""
+    return datetime.now().strftime("%I:%M %p")
+
+def _current_time() -> str:
+    """Get the current time as shown to the user, e.g. '03:45 PM'."""
+    return _format_time(int(time.time()) // 60)
+
 class ChatService:
     """
     Service class for handling chat conversations and command processing.
@@ -78,23 +102,8 @@ class ChatService:
             return response
             
         # Split into lines and filter out internal reasoning
-        lines = response.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip lines that contain internal reasoning artifacts
-            if (line.startswith('**Risk:**') or 
-                line.startswith('**Next Step:**') or
-                line.startswith('Risk:') or
-                line.startswith('Next Step:') or
-                'Risk:' in line and ('None detected' in line or 'Low' in line or 'Medium' in line or 'High' in line) or
-                'Next Step:' in line and ('Please' in line or 'Suggest' in line or 'provide' in line.lower())):
-                continue
-            if line:  # Only add non-empty lines
-                cleaned_lines.append(line)
-        
-        return ' '.join(cleaned_lines).strip()
+        lines = (line.strip() for line in response.splitlines())
+        return ' '.join(line for line in lines if line and not _REASONING_RE.match(line))
         
     async def _generate_response(self, user_text: str) -> str:
         """
@@ -107,26 +116,24 @@ class ChatService:
         Returns:
             str: The response text
         """
-        user_text_lower = user_text.lower()
+        found = {_COMMANDS[word.lower()] for word in _COMMAND_RE.findall(user_text)}
+        command = next((name for name in _COMMAND_PRIORITY if name in found), None)
         
         # Simple command processing - you can expand this
-        if "hello" in user_text_lower or "hi" in user_text_lower:
+        if command == "greeting":
             # Await the coroutine so we return a string, not a coroutine object
-            response = await self.llm_service.acomplete(user_text)
-            return self._clean_response(response)
+            return await self.llm_service.acomplete(user_text)
             
-        elif "time" in user_text_lower:
-            import datetime
-            current_time = datetime.datetime.now().strftime("%I:%M %p")
+        elif command == "time":
+            current_time = _current_time()
             return f"The current time is {current_time}"
             
-        elif "goodbye" in user_text_lower or "bye" in user_text_lower:
+        elif command == "goodbye":
             response = await self.llm_service.acomplete(user_text)
             sys.exit(self._clean_response(response))
         else:
             # Default response for unrecognized input
-            agent_response = await self.agent_executor.ainvoke(user_text)
-            return self._clean_response(agent_response)
+            return await self.agent_executor.ainvoke(user_text)
 
     async def synthesize_response(self, response_text: str, output_file: str = "output.wav"):
         """
@@ -140,7 +147,7 @@ class ChatService:
             return
             
         try:
-            await self.speech_service.synthesize(response_text, output_prefix="response")
+            await self.speech_service.synthesize(response_text, output_prefix=os.path.splitext(output_file)[0])
             logger.info(f"Response synthesized: {response_text}")
         except Exception as e:
             logger.error(f"Error synthesizing response: {e}")
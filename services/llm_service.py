@@ -4,7 +4,8 @@ import asyncio
 import os
 import logging
 from dataclasses import dataclass, field
-from typing import AsyncGenerator, Iterable, List, Mapping, Optional
+from functools import lru_cache
+from typing import AsyncGenerator, Iterable, List, Mapping, Optional, Tuple
 
 from langchain_core.caches import BaseCache as _LCBaseCache  # type: ignore
 from langchain_core.callbacks import Callbacks as _LCCallbacks  # type: ignore
@@ -14,6 +15,56 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Error message fragments (lowercase) that indicate a retryable failure
+_TRANSIENT_ERRORS = ("connection refused", "timeout", "temporary failure")
+
+
+@lru_cache(maxsize=4)
+def _build_chat_ollama(
+    model: str,
+    base_url: str,
+    temperature: float,
+    extra_items: Tuple[Tuple[str, object], ...],
+) -> ChatOllama:
+    """Initialize ChatOllama with safe model rebuild handling, once per configuration."""
+    try:
+        return ChatOllama(
+            model=model,
+            base_url=base_url,
+            temperature=temperature,
+            **dict(extra_items),
+        )
+    except Exception as e:
+        msg = str(e)
+        if "not fully defined" in msg or "model_rebuild" in msg or "BaseCache" in msg:
+            logger.warning("Rebuilding ChatOllama model schema...")
+
+            # Ensure BaseCache & Callbacks are in ChatOllama's module namespace
+            import importlib
+            from langchain_core.caches import BaseCache
+            from langchain_core.callbacks import Callbacks
+
+            chatollama_mod = importlib.import_module(ChatOllama.__module__)
+            setattr(chatollama_mod, "BaseCache", BaseCache)
+            setattr(chatollama_mod, "Callbacks", Callbacks)
+
+            try:
+                ChatOllama.model_rebuild(force=True)
+            except TypeError:
+                ChatOllama.model_rebuild()
+
+            return ChatOllama(
+                model=model,
+                base_url=base_url,
+                temperature=temperature,
+                **dict(extra_items),
+            )
+
+        raise RuntimeError(
+            f"Failed to initialize ChatOllama: {e}. Ensure Ollama is running at {base_url} "
+            f"and model '{model}' is available."
+        ) from e
+
 
 @dataclass
 class LLMConfig:
@@ -37,53 +88,29 @@ class AsyncLLMService:
             "Do not include risk assessments, next steps, or internal analysis in your responses. "
             "Just provide helpful, conversational replies."
         )
+        self._system_msg = SystemMessage(self.system_prompt)
 
         self._llm = self._init_llm()
 
     def _init_llm(self) -> ChatOllama:
-        """Initialize ChatOllama with safe model rebuild handling."""
+        """Get the shared ChatOllama client for this service's configuration."""
+        args = (
+            self.config.model,
+            self.config.base_url,
+            self.config.temperature,
+            tuple(sorted(self.config.extra_kwargs.items())),
+        )
         try:
-            return ChatOllama(
-                model=self.config.model,
-                base_url=self.config.base_url,
-                temperature=self.config.temperature,
-                **self.config.extra_kwargs,
-            )
-        except Exception as e:
-            msg = str(e)
-            if "not fully defined" in msg or "model_rebuild" in msg or "BaseCache" in msg:
-                logger.warning("Rebuilding ChatOllama model schema...")
-
-                # Ensure BaseCache & Callbacks are in ChatOllama's module namespace
-                import importlib
-                from langchain_core.caches import BaseCache
-                from langchain_core.callbacks import Callbacks
-
-                chatollama_mod = importlib.import_module(ChatOllama.__module__)
-                setattr(chatollama_mod, "BaseCache", BaseCache)
-                setattr(chatollama_mod, "Callbacks", Callbacks)
-
-                try:
-                    ChatOllama.model_rebuild(force=True)
-                except TypeError:
-                    ChatOllama.model_rebuild()
-
-                return ChatOllama(
-                    model=self.config.model,
-                    base_url=self.config.base_url,
-                    temperature=self.config.temperature,
-                    **self.config.extra_kwargs,
-                )
-
-            raise RuntimeError(
-                f"Failed to initialize ChatOllama: {e}. Ensure Ollama is running at {self.config.base_url} "
-                f"and model '{self.config.model}' is available."
-            ) from e
-
+            hash(args)
+        except TypeError:
+            # Unhashable extras (e.g. stop=[...]) can't key the cache; build a private client
+            return _build_chat_ollama.__wrapped__(*args)
+        return _build_chat_ollama(*args)
 
     def update_system_prompt(self, system_prompt: str) -> None:
         """Update the system prompt for future requests."""
         self.system_prompt = system_prompt or self.system_prompt
+        self._system_msg = SystemMessage(self.system_prompt)
 
     async def acomplete(
         self,
@@ -127,7 +154,7 @@ class AsyncLLMService:
                 if not self._should_retry(e, attempt):
                     self._raise_llm_error(e)
                 delay = self.config.retry_backoff * (2**attempt)
-                logger.warning(f"Retrying stream in {delay:.2f}s after error: {e}")
+                logger.warning("Retrying stream in %.2fs after error: %s", delay, e)
                 await asyncio.sleep(delay)
 
     def _compose_messages(
@@ -139,7 +166,7 @@ class AsyncLLMService:
         messages: List[object] = []
         history_msgs = self._convert_history(history) if history else []
         if not any(isinstance(m, SystemMessage) for m in history_msgs):
-            messages.append(SystemMessage(self.system_prompt))
+            messages.append(self._system_msg)
         messages.extend(history_msgs)
         messages.append(HumanMessage(prompt))
         return messages
@@ -169,7 +196,7 @@ class AsyncLLMService:
                 if not self._should_retry(e, attempt):
                     self._raise_llm_error(e)
                 delay = self.config.retry_backoff * (2**attempt)
-                logger.warning(f"Retrying {action} in {delay:.2f}s after error: {e}")
+                logger.warning("Retrying %s in %.2fs after error: %s", action, delay, e)
                 await asyncio.sleep(delay)
         raise RuntimeError(f"{action.capitalize()} failed after {self.config.max_retries} retries.")
 
@@ -177,8 +204,8 @@ class AsyncLLMService:
         """Decide whether to retry based on error type and attempt count."""
         if attempt >= self.config.max_retries - 1:
             return False
-        transient_errors = ("Connection refused", "Timeout", "Temporary failure")
-        return any(err.lower() in str(e).lower() for err in transient_errors)
+        msg = str(e).lower()
+        return any(err in msg for err in _TRANSIENT_ERRORS)
 
     def _raise_llm_error(self, e: Exception) -> None:
         raise RuntimeError(
@@ -1,126 +1,445 @@
 
 import asyncio
+import collections
+import concurrent.futures
+import logging
+from functools import lru_cache, partial
 from kokoro import KPipeline
 import soundfile as sf
 import torch
 from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+from transformers.utils import is_accelerate_available, is_flash_attn_2_available
 import sounddevice as sd
 import numpy as np
-import queue
+import threading
 from config.logger import get_logger
 
+try:
+    from faster_whisper import WhisperModel
+    HAS_FASTER_WHISPER = True
+except ImportError:  # Optional backend; the transformers Whisper pipeline is used instead
+    HAS_FASTER_WHISPER = False
+
+try:
+    from silero_vad import load_silero_vad
+    HAS_SILERO_VAD = True
+except ImportError:  # Optional; speech is detected from block energy instead
+    HAS_SILERO_VAD = False
+
 logger = get_logger(__name__)
 
+# Whisper runs on one worker thread so concurrent listeners never share the GPU at once
+_model_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="saba-whisper")
+
+@lru_cache(maxsize=4)
+def _get_pipeline(lang_code: str) -> KPipeline:
+    """Load the Kokoro pipeline for a language once and share it."""
+    return KPipeline(lang_code=lang_code)
+
+@lru_cache(maxsize=2)
+def _load_whisper(device: str, torch_dtype: torch.dtype):
+    """Load Whisper once per device and return (model, pipe); pipe is None for faster-whisper."""
+    if HAS_FASTER_WHISPER:
+        # CTranslate2 int8 weights with a fused decoder loop
+        model = WhisperModel("large-v3", device=device.split(":")[0], compute_type=_compute_type())
+        return model, None
+    
+    model_id = "openai/whisper-large-v3"
+    # Fused attention kernels: FlashAttention-2 when installed on GPU, else PyTorch SDPA
+    use_flash = torch.cuda.is_available() and is_flash_attn_2_available()
+    # With accelerate installed, device_map mmaps the safetensors shards and places
+    # each tensor on the target device directly instead of staging the model on the host
+    placement = {"device_map": {"": device}} if is_accelerate_available() else {}
+    model = AutoModelForSpeechSeq2Seq.from_pretrained(
+        model_id, torch_dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True,
+        attn_implementation="flash_attention_2" if use_flash else "sdpa",
+        **placement
+    )
+    processor = AutoProcessor.from_pretrained(model_id)
+    
+    pipe = pipeline(
+        "automatic-speech-recognition",
+        model=model,
+        tokenizer=processor.tokenizer,
+        feature_extractor=processor.feature_extractor,
+        torch_dtype=torch_dtype,
+        # A device_map-placed model already sits on the device; otherwise the pipeline moves it
+        device=None if placement else device,
+        chunk_length_s=30,
+        batch_size=8
+    )
+    pipe.model.eval()
+    
+    if torch.cuda.is_available() and _torch_version() >= (2, 1):
+        # Fuse the encoder's conv/GELU/LayerNorm blocks and capture them as CUDA
+        # graphs; a short silent clip compiles them before the first real utterance
+        model.model.encoder = torch.compile(model.model.encoder, mode="reduce-overhead", fullgraph=False)
+        with torch.inference_mode():
+            pipe(np.zeros(16000 * 5, dtype=np.float32), generate_kwargs={"language": "en"})
+    return model, pipe
+
+def _torch_version():
+    """Major and minor version of the installed torch."""
+    return tuple(int(part) for part in torch.__version__.split("+")[0].split(".")[:2])
+
+def _compute_type() -> str:
+    """Pick the CTranslate2 compute type: int8 with fp16 on Tensor Core GPUs."""
+    if not torch.cuda.is_available():
+        return "int8"
+    return "int8_float16" if torch.cuda.get_device_capability()[0] >= 7 else "float16"
+
+class BatchedWhisper:
+    """
+    Transcribes utterances for every service sharing one Whisper model.
+    Whatever queues up while the model is busy goes through in a single batched call.
+    """
+    MAX_BATCH = 8
+
+    def __init__(self, model, pipe):
+        self.model = model
+        self.pipe = pipe
+        # Queues and worker tasks belong to one event loop each
+        self._queues = {}
+
+    async def submit(self, audio: np.ndarray) -> str:
+        """Queue one utterance and wait for its transcription."""
+        loop = asyncio.get_running_loop()
+        for old in [old for old in self._queues if old.is_closed()]:
+            del self._queues[old]
+        queue, worker = self._queues.get(loop, (None, None))
+        if worker is None or worker.done():
+            queue = asyncio.Queue()
+            self._queues[loop] = (queue, loop.create_task(self._run(queue)))
+        future = loop.create_future()
+        queue.put_nowait((audio, future))
+        return await future
+
+    async def _run(self, queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # No waiting window: a lone utterance starts at once, and anything
+            # submitted while the previous batch ran is taken together
+            while len(batch) < self.MAX_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            audios = [audio for audio, _ in batch]
+            try:
+                texts = await loop.run_in_executor(_model_executor, self.transcribe_batch, audios)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), text in zip(batch, texts):
+                    if not future.done():
+                        future.set_result(text)
+
+    def transcribe(self, chunk: np.ndarray) -> str:
+        """Transcribe one utterance with whichever Whisper backend is loaded."""
+        if self.pipe is None:
+            segments, _ = self.model.transcribe(chunk, language="en", beam_size=1, vad_filter=False)
+            return "".join(segment.text for segment in segments).strip()
+        with torch.inference_mode():
+            result = self.pipe(
+                chunk,
+                return_timestamps=True,
+                generate_kwargs={"language": "en"}
+            )
+        return result.get("text")
+
+    def transcribe_batch(self, chunks):
+        """Transcribe several utterances, batched through the HF pipeline when it is loaded."""
+        if self.pipe is None or len(chunks) == 1:
+            return [self.transcribe(chunk) for chunk in chunks]
+        with torch.inference_mode():
+            results = self.pipe(
+                list(chunks),
+                return_timestamps=True,
+                batch_size=len(chunks),
+                generate_kwargs={"language": "en"}
+            )
+        return [result.get("text") for result in results]
+
+@lru_cache(maxsize=2)
+def _get_batcher(device: str, torch_dtype: torch.dtype) -> BatchedWhisper:
+    """One batcher per loaded Whisper model, shared by every service that uses it."""
+    return BatchedWhisper(*_load_whisper(device, torch_dtype))
+
 class AsyncSpeechService:
+    VAD_WINDOW = 512  # samples per Silero VAD call at 16 kHz
+    BASELINE_REFRESH = 10  # blocks between recomputing the adaptive speech threshold
+    RING_SECONDS = 30  # longest utterance kept in the capture buffer
+
     def __init__(self, lang_code='a', voice='bf_alice'):
-        self.pipeline = KPipeline(lang_code=lang_code)
+        self._lang_code = lang_code
         self.voice = voice
         
         # Initialize Whisper model
         self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
         self.torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
         
-        model_id = "openai/whisper-large-v3"
         logger.info(f"Device set to use {self.device}")
         
-        self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-            model_id, torch_dtype=self.torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
-        ).to(self.device)
-        self.processor = AutoProcessor.from_pretrained(model_id)
-        
-        self.pipe = pipeline(
-            "automatic-speech-recognition",
-            model=self.model,
-            tokenizer=self.processor.tokenizer,
-            feature_extractor=self.processor.feature_extractor,
-            torch_dtype=self.torch_dtype,
-            device=self.device
-        )
-        self.pipe.model.eval()
+        self.model, self.pipe = _load_whisper(self.device, self.torch_dtype)
         
         # Audio config
         self.samplerate = 16000
         self.channels = 1
         self.block_duration = 0.5
         self.silence_threshold = 0.01
-        self.silence_duration_end = 1.0
+        self.silence_duration_end = 0.5
         self.MIN_SPEECH_DURATION = 1.0
+        
+        # Rolling 30 s of block levels; their 30th percentile estimates the noise
+        # floor, so the threshold follows the room up as well as down
+        self.level_history = collections.deque(maxlen=int(30 / self.block_duration))
+        self._baseline = None
+        self._blocks_since_baseline = 0
+        self._abs_buf = np.empty(int(self.samplerate * self.block_duration), dtype=np.float32)
+        
+        # Silero VAD (ONNX, single-threaded) gives a real speech probability, so
+        # the end of an utterance can be called sooner and short replies kept
+        self._vad = load_silero_vad(onnx=True) if HAS_SILERO_VAD else None
+        # Samples left over from the last block, fed to the VAD ahead of the next one
+        self._vad_tail = np.empty(0, dtype=np.float32)
+        if self._vad is not None:
+            self.silence_duration_end = 0.4
+            self.MIN_SPEECH_DURATION = 0.0
+        
+        # Preallocated capture buffer the audio callback writes into; an utterance
+        # is sliced out of it once instead of being queued and concatenated
+        self._ring = np.empty(int(self.RING_SECONDS * self.samplerate), dtype=np.float32)
+        self._wpos = 0
+        self._ring_ready = threading.Condition()
+        
+        # Utterances from services sharing this model are transcribed together
+        self._batcher = _get_batcher(self.device, self.torch_dtype)
+        
+        # Dedicated thread for audio file writes, kept off the shared default executor
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="saba-audio-io")
+        # Blocking speaker writes get their own thread so they never hold up file writes
+        self._playback_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="saba-audio-out")
 
-    async def synthesize(self, text: str, output_prefix: str = "output"):
-        loop = asyncio.get_event_loop()
+    @property
+    def pipeline(self) -> KPipeline:
+        """Kokoro pipeline, loaded on first synthesis so STT-only callers never pay for it."""
+        return _get_pipeline(self._lang_code)
+
+    async def synthesize(self, text: str, output_prefix: str = "output", play: bool = False):
+        """
+        Synthesize text to f"{output_prefix}.wav" (skipped when the prefix is empty).
+        With play=True each chunk is also sent to the speakers as soon as it is generated.
+        """
+        loop = asyncio.get_running_loop()
         generator = self.pipeline(text, voice=self.voice)
-        tasks = []
-        for i, (gs, ps, audio) in enumerate(generator):
-            logger.debug(f"Synthesis iteration {i}: gs={gs}, ps={ps}")
-            # Write audio asynchronously
-            task = loop.run_in_executor(None, sf.write, f'output.wav', audio, 24000)
-            tasks.append(task)
-        await asyncio.gather(*tasks)
+        # Skip building the per-chunk debug string unless DEBUG is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # One file per utterance; chunks are appended in order on the single audio write thread
+        sound_file = None
+        out_stream = None
+        pending = []
+        try:
+            for i, (gs, ps, audio) in enumerate(generator):
+                if debug:
+                    logger.debug(f"Synthesis iteration {i}: gs={gs}, ps={ps}")
+                if play:
+                    if out_stream is None:
+                        out_stream = sd.OutputStream(samplerate=24000, channels=1, dtype='float32', blocksize=2048)
+                        out_stream.start()
+                    samples = np.asarray(audio, dtype=np.float32).reshape(-1, 1)
+                    pending.append(loop.run_in_executor(self._playback_pool, out_stream.write, samples))
+                if output_prefix:
+                    if sound_file is None:
+                        sound_file = await loop.run_in_executor(
+                            self._io_pool, partial(sf.SoundFile, f'{output_prefix}.wav', mode='w', samplerate=24000, channels=1)
+                        )
+                    pending.append(loop.run_in_executor(self._io_pool, sound_file.write, audio))
+            await asyncio.gather(*pending)
+        finally:
+            if sound_file is not None:
+                await loop.run_in_executor(self._io_pool, sound_file.close)
+            if out_stream is not None:
+                # stop() lets queued buffers play out; close() alone discards them
+                await loop.run_in_executor(self._playback_pool, out_stream.stop)
+                await loop.run_in_executor(self._playback_pool, out_stream.close)
+
+    async def close(self):
+        """Shut down the audio write and playback threads."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._io_pool.shutdown)
+        await loop.run_in_executor(None, self._playback_pool.shutdown)
 
     def audio_callback(self, indata, frames, time_, status):
         if status:
             logger.warning(f"Audio callback status: {status}")
-        self.q.put(indata.copy())
+        # Copy straight into the capture buffer; samples past its end are dropped
+        with self._ring_ready:
+            n = min(frames, len(self._ring) - self._wpos)
+            self._ring[self._wpos:self._wpos + n] = indata[:n, 0]
+            self._wpos += n
+            self._ring_ready.notify()
 
     def is_speech(self, audio, threshold=None):
-        if threshold is None:
-            threshold = self.silence_threshold
-        return np.mean(np.abs(audio)) > threshold
+        if self._vad is not None and threshold is None:
+            return self._speech_probability(audio) > 0.5
+        level = self._mean_abs(audio)
+        if threshold is not None:
+            return level > threshold
+
+        # silence_threshold is the floor, so a near-silent room can't let clicks through
+        threshold = self.silence_threshold
+        if self._baseline is not None:
+            threshold = max(threshold, self._baseline * 1.2)
+        speech = level > threshold
 
-    def listen(self):
+        # Every block feeds the history. A low percentile ignores the speaker's
+        # own level but still rises when the background gets louder
+        self.level_history.append(level)
+        self._blocks_since_baseline += 1
+        if self._blocks_since_baseline >= self.BASELINE_REFRESH:
+            self._baseline = float(np.quantile(self.level_history, 0.3))
+            self._blocks_since_baseline = 0
+        return speech
+
+    def _mean_abs(self, audio):
+        """Mean absolute amplitude, computed in a reused scratch buffer."""
+        n = audio.shape[0]
+        if n > self._abs_buf.shape[0]:
+            self._abs_buf = np.empty(n, dtype=np.float32)
+        scratch = self._abs_buf[:n]
+        np.abs(audio, out=scratch)
+        return float(scratch.sum()) / n if n else 0.0
+
+    def _speech_probability(self, audio):
+        """
+        Highest Silero VAD speech probability over the block's 512-sample windows.
+        Samples that don't fill a window are carried into the next call, so the
+        stateful VAD sees the stream without gaps.
+        """
+        samples = np.concatenate((self._vad_tail, audio)) if len(self._vad_tail) else audio
+        usable = len(samples) - len(samples) % self.VAD_WINDOW
+        self._vad_tail = np.array(samples[usable:], dtype=np.float32)
+        windows = np.ascontiguousarray(samples[:usable], dtype=np.float32).reshape(-1, self.VAD_WINDOW)
+        return max((self._vad(torch.from_numpy(window), self.samplerate).item() for window in windows), default=0.0)
+
+    async def listen(self):
         """
         Listens to the microphone and returns the recognized speech as text.
         Uses Whisper model for speech recognition.
         """
-        self.q = queue.Queue()
-        
-        logger.info("Listening... Press Ctrl+C to stop.")
+        # Capture and transcription block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        chunk = await loop.run_in_executor(None, self._next_utterance)
+        if chunk is None:
+            return None
+        try:
+            logger.info("Processing speech...")
+            text = await self._batcher.submit(chunk)
+            logger.info(f"Transcription: {text}")
+            return text
+        except Exception as e:
+            logger.error(f"Error during speech recognition: {e}")
+            return None
+
+    async def listen_stream(self):
+        """
+        Listens continuously and yields each utterance's transcription.
+        Capture of the next utterance carries on while the previous one is transcribed.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+        stop = threading.Event()
+
+        def capture():
+            try:
+                for chunk in self._capture_utterances(stop):
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+            finally:
+                loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+        capture_task = loop.run_in_executor(None, capture)
         try:
-            with sd.InputStream(
-                samplerate=self.samplerate,
-                channels=self.channels,
-                callback=self.audio_callback,
-                blocksize=int(self.samplerate * self.block_duration)
-            ):
-                speech_buffer = []
-                recording = False
-                silence_blocks = 0
-
-                while True:
-                    audio_block = self.q.get()
-                    audio_np = np.squeeze(audio_block)
-
-                    if self.is_speech(audio_np):
-                        speech_buffer.append(audio_np)
-                        recording = True
-                        silence_blocks = 0
-                    elif recording:
-                        silence_blocks += 1
-                        speech_buffer.append(audio_np)
-
-                        if silence_blocks * self.block_duration >= self.silence_duration_end:
-                            chunk = np.concatenate(speech_buffer)
-                            speech_buffer = []
-                            recording = False
-
-                            duration = len(chunk) / self.samplerate
-                            if duration >= self.MIN_SPEECH_DURATION:
-                                logger.info("Processing speech...")
-                                result = self.pipe(
-                                    chunk,
-                                    return_timestamps=True,
-                                    generate_kwargs={"language": "en"}
-                                )
-                                text = result.get("text")
-                                logger.info(f"Transcription: {text}")
-                                return text
-                            else:
-                                logger.debug("[Too short, skipping transcription]")
+            while (chunk := await chunks.get()) is not None:
+                logger.info("Processing speech...")
+                text = await self._batcher.submit(chunk)
+                logger.info(f"Transcription: {text}")
+                if text:
+                    yield text
+        finally:
+            stop.set()
+            with self._ring_ready:
+                self._ring_ready.notify_all()
+            await capture_task
 
+    def _next_utterance(self):
+        """Record until the speaker goes quiet and return the utterance, or None."""
+        utterances = self._capture_utterances()
+        try:
+            return next(utterances, None)
         except KeyboardInterrupt:
             logger.info("Stopped listening.")
             return None
         except Exception as e:
             logger.error(f"Error during speech recognition: {e}")
             return None
-        
\ No newline at end of file
+        finally:
+            # Stop the microphone before the utterance is transcribed
+            utterances.close()
+
+    def _capture_utterances(self, stop=None):
+        """Yield each utterance from the microphone as one array until stop is set."""
+        with self._ring_ready:
+            self._wpos = 0
+        if self._vad is not None:
+            self._vad.reset_states()
+            self._vad_tail = np.empty(0, dtype=np.float32)
+        
+        block = int(self.samplerate * self.block_duration)
+        logger.info("Listening... Press Ctrl+C to stop.")
+        with sd.InputStream(
+            samplerate=self.samplerate,
+            channels=self.channels,
+            callback=self.audio_callback,
+            blocksize=block
+        ):
+            rpos = 0  # start of the next unread block
+            start = None  # start of the utterance being recorded
+            silence_blocks = 0
+
+            while stop is None or not stop.is_set():
+                with self._ring_ready:
+                    self._ring_ready.wait_for(
+                        lambda: self._wpos - rpos >= block or (stop is not None and stop.is_set())
+                    )
+                if self._wpos - rpos < block:
+                    break
+                audio_np = self._ring[rpos:rpos + block]
+                rpos += block
+                buffer_full = rpos + block > len(self._ring)
+
+                if self.is_speech(audio_np):
+                    if start is None:
+                        start = rpos - block
+                    silence_blocks = 0
+                elif start is not None:
+                    silence_blocks += 1
+
+                if start is not None and (buffer_full or silence_blocks * self.block_duration >= self.silence_duration_end):
+                    chunk = self._ring[start:rpos].copy()
+                    start = None
+                    silence_blocks = 0
+
+                    duration = len(chunk) / self.samplerate
+                    if duration >= self.MIN_SPEECH_DURATION:
+                        yield chunk
+                    else:
+                        logger.debug("[Too short, skipping transcription]")
+
+                if start is None:
+                    # Nothing to keep: move any unread samples to the front
+                    with self._ring_ready:
+                        pending = self._wpos - rpos
+                        self._ring[:pending] = self._ring[rpos:self._wpos]
+                        self._wpos = pending
+                    rpos = 0
@@ -1,94 +1,21 @@
-import torch
-from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
-import sounddevice as sd
-import numpy as np
-import queue
+import asyncio
+from services.speech_service import AsyncSpeechService
 from config.logger import get_logger
 
 logger = get_logger(__name__)
 
-# ===== Model & Device Config =====
-device = "cuda:0" if torch.cuda.is_available() else "cpu"
-torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-
-model_id = "openai/whisper-large-v3"
-logger.info(f"Device set to use {device}")
-
-model = AutoModelForSpeechSeq2Seq.from_pretrained(
-    model_id, torch_dtype=torch_dtype, low_cpu_mem_usage=True, use_safetensors=True
-).to(device)
-processor = AutoProcessor.from_pretrained(model_id)
-
-pipe = pipeline(
-    "automatic-speech-recognition",
-    model=model,
-    tokenizer=processor.tokenizer,
-    feature_extractor=processor.feature_extractor,
-    torch_dtype=torch_dtype,
-    device=device
-)
-pipe.model.eval()  # Slight efficiency boost
-
-# ===== Audio Config =====
-samplerate = 16000
-channels = 1
-block_duration = 0.5  # seconds per chunk
-silence_threshold = 0.01
-silence_duration_end = 1.0  # seconds before we decide you stopped talking
-MIN_SPEECH_DURATION = 1.0  # seconds before we send to Whisper
-
-# ===== Queue for audio stream =====
-q = queue.Queue()
-
-def audio_callback(indata, frames, time_, status):
-    if status:
-        logger.warning(f"Audio callback status: {status}")
-    q.put(indata.copy())
-
-def is_speech(audio, threshold=silence_threshold):
-    return np.mean(np.abs(audio)) > threshold
-
-# ===== Main Listening Loop =====
-logger.info("Listening... Press Ctrl+C to stop.")
-try:
-    with sd.InputStream(
-        samplerate=samplerate,
-        channels=channels,
-        callback=audio_callback,
-        blocksize=int(samplerate * block_duration)
-    ):
-        speech_buffer = []
-        recording = False
-        silence_blocks = 0
-
-        while True:
-            audio_block = q.get()
-            audio_np = np.squeeze(audio_block)
-
-            if is_speech(audio_np):
-                speech_buffer.append(audio_np)
-                recording = True
-                silence_blocks = 0
-            elif recording:
-                silence_blocks += 1
-                speech_buffer.append(audio_np)
-
-                if silence_blocks * block_duration >= silence_duration_end:
-                    chunk = np.concatenate(speech_buffer)
-                    speech_buffer = []
-                    recording = False
-
-                    duration = len(chunk) / samplerate
-                    if duration >= MIN_SPEECH_DURATION:
-                        logger.info("Processing speech...")
-                        result = pipe(
-                            chunk,
-                            return_timestamps=True,
-                            generate_kwargs={"language": "en"}  # Force English
-                        )
-                        logger.info(f"Transcription: {result.get('text')}")
-                    else:
-                        logger.debug("[Too short, skipping transcription]")
-
-except KeyboardInterrupt:
-    logger.info("Stopped listening.")
+async def transcribe_forever():
+    """Transcribe the microphone until interrupted; listen_stream logs each utterance."""
+    speech_service = AsyncSpeechService()
+    async for _ in speech_service.listen_stream():
+        pass
+
+def main():
+    """Standalone microphone transcription check for the Whisper setup."""
+    try:
+        asyncio.run(transcribe_forever())
+    except KeyboardInterrupt:
+        logger.info("Stopped listening.")
+
+if __name__ == "__main__":
+    main()
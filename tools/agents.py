@@ -1,14 +1,20 @@
 
 
+from typing import Dict
 from langchain_core.tools import render_text_description, tool as lc_tool
 from langchain.agents import AgentExecutor, create_react_agent
+from langchain_core.prompts import PromptTemplate
 from tools.api_tools import APITools
 import asyncio
 from services.llm_service import AsyncLLMService
+from tools.text_cleanup import reasoning_line_re
 
 llm_service = AsyncLLMService()
 api_tools = APITools()
 
+# Internal reasoning lines dropped from the final answer
+_DROP_RE = reasoning_line_re()
+
 # String-compatible wrappers for all API tools
 
 # Wrappers now call the public string-compatible tool methods
@@ -46,17 +52,8 @@ tool_methods = [
 ]
 
 
-class AsyncAgentExecutor:
-    def __init__(self, llm, tools=tool_methods, verbose=False, format="json"):
-        self.llm = llm
-        self.tools = tools
-        self.verbose = verbose
-        self.format = format
-        self.agent_executor = None
-
-    async def setup(self):
-        # JARVIS-like, concise ReAct prompt with private reasoning
-        prompt_template = """
+# JARVIS-like, concise ReAct prompt with private reasoning
+_PROMPT_TEMPLATE = """
             You are Saba, a JARVIS-like AI copilot. Be direct, proactive, and action-focused.
             - Keep replies to 1–2 short sentences.
             - Ask only essential clarifying questions when strictly needed.
@@ -82,21 +79,47 @@ class AsyncAgentExecutor:
             Question: {input}
             Thought: {agent_scratchpad}
         """
-        from langchain_core.prompts import PromptTemplate
-        prompt = PromptTemplate.from_template(prompt_template)
-        prompt = prompt.partial(
-            tools=render_text_description(self.tools),
-            tool_names=", ".join([t.name for t in self.tools]),
-        )
-        agent = create_react_agent(self.llm, self.tools, prompt)
-        self.agent_executor = AgentExecutor(
-            agent=agent,
-            tools=self.tools,
-            handle_parsing_errors=True,
-            verbose=self.verbose,
-            format=self.format,
-            max_iterations=10,
-        )
+
+def _build_prompt(tools) -> PromptTemplate:
+    """ReAct prompt with the tool descriptions and names filled in."""
+    return PromptTemplate.from_template(_PROMPT_TEMPLATE).partial(
+        tools=render_text_description(tools),
+        tool_names=", ".join([t.name for t in tools]),
+    )
+
+# Rendered once for the default tool set
+_PROMPT = _build_prompt(tool_methods)
+
+# AgentExecutors keyed on (llm id, tool ids, verbose, format); each executor
+# holds its llm and tools, so the ids can't be reused while cached
+_EXECUTORS: Dict[tuple, AgentExecutor] = {}
+
+
+class AsyncAgentExecutor:
+    def __init__(self, llm, tools=tool_methods, verbose=False, format="json"):
+        self.llm = llm
+        self.tools = tools
+        self.verbose = verbose
+        self.format = format
+        self.agent_executor = None
+
+    async def setup(self):
+        # Executors are shared by every instance with the same LLM, tools and options
+        key = (id(self.llm), tuple(id(t) for t in self.tools), self.verbose, self.format)
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            prompt = _PROMPT if self.tools is tool_methods else _build_prompt(self.tools)
+            agent = create_react_agent(self.llm, self.tools, prompt)
+            executor = AgentExecutor(
+                agent=agent,
+                tools=self.tools,
+                handle_parsing_errors=True,
+                verbose=self.verbose,
+                format=self.format,
+                max_iterations=10,
+            )
+            _EXECUTORS[key] = executor
+        self.agent_executor = executor
 
     async def ainvoke(self, input_text):
         if self.agent_executor is None:
@@ -108,21 +131,8 @@ class AsyncAgentExecutor:
         # Clean up the output by removing internal reasoning artifacts
         if isinstance(output, str):
             # Remove risk assessments and next steps that should be internal
-            lines = output.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                # Skip lines that contain internal reasoning artifacts
-                if (line.startswith('**Risk:**') or 
-                    line.startswith('**Next Step:**') or
-                    line.startswith('Risk:') or
-                    line.startswith('Next Step:') or
-                    'Risk:' in line and ('None detected' in line or 'Low' in line or 'Medium' in line or 'High' in line) or
-                    'Next Step:' in line and ('Please' in line or 'Suggest' in line)):
-                    continue
-                if line:  # Only add non-empty lines
-                    cleaned_lines.append(line)
-            output = ' '.join(cleaned_lines).strip()
+            lines = (line.strip() for line in output.split('\n'))
+            output = ' '.join(line for line in lines if line and not _DROP_RE.match(line))
         
         # Try to detect a movie info dict and format a final answer
         if isinstance(output, dict) and all(k in output for k in ("Title", "Plot", "Year")):
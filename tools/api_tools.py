@@ -1,49 +1,92 @@
 
 # Only keep the correct, DRY, string-compatible APITools implementation
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 import httpx
-from config.config import Settings
+import orjson
+from config.config import settings
 from langchain_core.tools import tool
 
+# Seconds a successful response stays cached: weather changes, titles don't,
+# and the caller's own IP location is looked up once per session
+WEATHER_TTL = 300
+LOOKUP_TTL = 24 * 60 * 60
+SESSION_TTL = float("inf")
+# Most responses kept at once; the least recently used is dropped first
+CACHE_SIZE = 256
+
 class APITools:
+    BASE_IPINFO = "https://ipinfo.io/json"
+    BASE_WEATHER = "https://api.tomorrow.io/v4/weather/realtime"
+    BASE_OMDB = "http://www.omdbapi.com/"
+    BASE_MAL = "https://api.myanimelist.net/v2/anime"
+    MAL_FIELDS = "synopsis,genres,media_type,nsfw,num_episodes,status,source,title,rating,related_anime"
+
     def __init__(self):
-        self.settings = Settings()
-
-    async def _fetch(self, url: str, headers: dict = None) -> dict:
-        """Generic async GET request helper."""
-        async with httpx.AsyncClient(timeout=10) as client:
-            try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError:
-                return {}
-            except Exception:
-                return {}
+        self.settings = settings
+        self._mal_headers = {"X-MAL-CLIENT-ID": self.settings.MAL_API_CLIENT_ID}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: OrderedDict[Tuple, Tuple[float, bytes]] = OrderedDict()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10, limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch(self, url: str, params: dict = None, headers: dict = None, ttl: float = 0) -> dict:
+        """Generic async GET request helper; successful responses are cached for ttl seconds."""
+        key = (
+            url,
+            tuple(sorted(params.items())) if params else None,
+            tuple(sorted(headers.items())) if headers else None,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                # Raw bytes are cached so every hit gets its own dict to mutate
+                return orjson.loads(cached[1])
+            del self._cache[key]
+        try:
+            response = await self.client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except Exception:
+            return {}
+        if ttl and data:
+            self._cache[key] = (time.monotonic() + ttl, response.content)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return data
 
     async def _get_location_raw(self, ipAddress: str = "") -> str:
-        url = f'https://ipinfo.io/json?token={self.settings.IPINFO_KEY}'
-        data = await self._fetch(url)
+        data = await self._fetch(self.BASE_IPINFO, params={"token": self.settings.IPINFO_KEY}, ttl=SESSION_TTL)
         return data.get('city', '') if isinstance(data, dict) else ''
 
     async def _get_weather_raw(self, city: str) -> dict:
-        url = (
-            f"https://api.tomorrow.io/v4/weather/realtime"
-            f"?location={city}&apikey={self.settings.WEATHER_API_KEY}"
-        )
-        return await self._fetch(url)
+        params = {"location": city, "apikey": self.settings.WEATHER_API_KEY}
+        return await self._fetch(self.BASE_WEATHER, params=params, ttl=WEATHER_TTL)
 
     async def _get_movie_info_raw(self, title: str) -> dict:
-        url = f"http://www.omdbapi.com/?t={title}&apikey={self.settings.OMDB_API_KEY}"
-        return await self._fetch(url)
+        params = {"t": title, "apikey": self.settings.OMDB_API_KEY}
+        return await self._fetch(self.BASE_OMDB, params=params, ttl=LOOKUP_TTL)
 
     async def _get_anime_info_raw(self, title: str) -> dict:
-        api_url = (
-            f"https://api.myanimelist.net/v2/anime?q={title}"
-            "&limit=1&fields=synopsis,genres,media_type,nsfw,num_episodes,"
-            "status,source,title,rating,related_anime"
-        )
-        headers = {"X-MAL-CLIENT-ID": self.settings.MAL_API_CLIENT_ID}
-        return await self._fetch(api_url, headers=headers)
+        params = {"q": title, "limit": 1, "fields": self.MAL_FIELDS}
+        return await self._fetch(self.BASE_MAL, params=params, headers=self._mal_headers, ttl=LOOKUP_TTL)
 
     # -----------------------
     # LANGCHAIN TOOL METHODS (string compatible)
@@ -0,0 +1,17 @@
+"""Helpers for cleaning LLM output before it is shown or spoken."""
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def reasoning_line_re(next_step_words: str = "Please|Suggest") -> re.Pattern:
+    """
+    Match internal reasoning lines the LLM sometimes leaks: a leading Risk/Next Step
+    label, a Risk line carrying a rating, or a Next Step line containing one of
+    next_step_words (a regex alternation).
+    """
+    return re.compile(
+        r"^(?:\*\*(?:Risk|Next Step):\*\*|(?:Risk|Next Step):)"
+        r"|^(?=.*Risk:).*(?:None detected|Low|Medium|High)"
+        rf"|^(?=.*Next Step:).*(?:{next_step_words})"
+    )